@@ -52,7 +52,7 @@
     Unknown,
     VAUXBinaryGroup,
 )
-from .parser import parse_binary
+from .parser import parse_binary, parse_binary_batch
 from .source_control import (
     CompressionCount,
     CopyProtection,
@@ -119,6 +119,7 @@
     "Pack",
     "PanningDirection",
     "parse_binary",
+    "parse_binary_batch",
     "PolarityCorrection",
     "SourceCode",
     "SourceSituation",
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import ctypes
 from dataclasses import dataclass
 from enum import IntEnum
 from typing import ClassVar
@@ -53,7 +52,7 @@ class AudioQuantization(IntEnum):
 #
 # NOTE: The values are only unique within a given audio block channel: i.e. first 5 or 6 DIF blocks
 # in a given sequence, or the second half of the DIF blocks in the sequence.
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AAUXSource(Pack):
     # Basic audio information for a channel
     sample_frequency: int | None = None
@@ -366,29 +365,14 @@ def to_text_value(cls, text_field: str | None, value_subset: DataclassInstance)
             case _:
                 assert False
 
-    class _BinaryFields(ctypes.BigEndianStructure):
-        _pack_ = 1
-        _fields_: ClassVar = [
-            # PC 1
-            ("lf", ctypes.c_uint8, 1),
-            ("one_1", ctypes.c_uint8, 1),
-            ("af_size", ctypes.c_uint8, 6),
-            # PC 2
-            ("sm", ctypes.c_uint8, 1),
-            ("chn", ctypes.c_uint8, 2),
-            ("pa", ctypes.c_uint8, 1),
-            ("audio_mode", ctypes.c_uint8, 4),
-            # PC 3
-            ("one_2", ctypes.c_uint8, 1),
-            ("ml", ctypes.c_uint8, 1),
-            ("field_count", ctypes.c_uint8, 1),
-            ("stype", ctypes.c_uint8, 5),
-            # PC 4
-            ("ef", ctypes.c_uint8, 1),
-            ("tc", ctypes.c_uint8, 1),
-            ("smp", ctypes.c_uint8, 3),
-            ("qu", ctypes.c_uint8, 3),
-        ]
+    # Binary layout of the pack data bytes, from the most significant bit to the least:
+    #   PC 1: LF (1 bit), reserved, always 1 (1 bit), AF SIZE (6 bits)
+    #   PC 2: SM (1 bit), CHN (2 bits), PA (1 bit), AUDIO MODE (4 bits)
+    #   PC 3: reserved, always 1 (1 bit), ML (1 bit), 50/60 (1 bit), STYPE (5 bits)
+    #   PC 4: EF (1 bit), TC (1 bit), SMP (3 bits), QU (3 bits)
+    #
+    # The fields are unpacked with plain shifts and masks, which avoids allocating a ctypes
+    # structure for every parsed pack.
 
     pack_type = Type.AAUX_SOURCE
 
@@ -412,72 +396,96 @@ class _BinaryFields(ctypes.BigEndianStructure):
         2: 0x1,
     }
 
+    # Single-bit fields are decoded by indexing these tuples, which is much cheaper than calling
+    # the IntEnum constructor for every parsed pack.
+    __lf_to_locked_mode: ClassVar[tuple[LockedMode, ...]] = (
+        LockedMode.LOCKED,
+        LockedMode.UNLOCKED,
+    )
+    __sm_to_stereo_mode: ClassVar[tuple[StereoMode, ...]] = (
+        StereoMode.MULTI_STEREO_AUDIO,
+        StereoMode.LUMPED_AUDIO,
+    )
+    __pa_to_audio_block_pairing: ClassVar[tuple[AudioBlockPairing, ...]] = (
+        AudioBlockPairing.PAIRED,
+        AudioBlockPairing.INDEPENDENT,
+    )
+    __tc_to_emphasis_time_constant: ClassVar[tuple[EmphasisTimeConstant, ...]] = (
+        EmphasisTimeConstant.RESERVED,
+        EmphasisTimeConstant.E_50_15,
+    )
+
     @classmethod
     def _do_parse_binary(
         cls, pack_bytes: bytes, system: dv_file_info.DVSystem
     ) -> AAUXSource | None:
         # Unpack fields from bytes and validate them.
-        bin = cls._BinaryFields.from_buffer_copy(pack_bytes, 1)
+        pc1, pc2, pc3, pc4 = pack_bytes[1], pack_bytes[2], pack_bytes[3], pack_bytes[4]
 
-        sample_frequency = cls.__smp_to_freq.get(bin.smp)
+        sample_frequency = cls.__smp_to_freq.get((pc4 >> 3) & 0x07)
         if sample_frequency is None:
             return None
 
-        if bin.one_1 != 1 or bin.one_2 != 1:
+        if pc1 & 0x40 == 0 or pc3 & 0x80 == 0:
             return None
 
         # We rely on validation to throw this pack out if we end up assigning None to some fields,
         # or writing some other invalid things like audio_samples_per_frame out of range.
+        qu = pc4 & 0x07
         return cls(
             sample_frequency=sample_frequency,
-            quantization=AudioQuantization(bin.qu) if bin.qu in AudioQuantization else None,
+            quantization=AudioQuantization(qu) if qu in AudioQuantization else None,
             audio_samples_per_frame=(
-                cls.__audio_samples_per_frame_ranges[system][sample_frequency][0] + bin.af_size
+                cls.__audio_samples_per_frame_ranges[system][sample_frequency][0] + (pc1 & 0x3F)
             ),
-            locked_mode=LockedMode(bin.lf),
-            stereo_mode=StereoMode(bin.sm),
-            audio_block_channel_count=cls.__chn_to_channel_count.get(bin.chn),
-            audio_mode=bin.audio_mode,
-            audio_block_pairing=AudioBlockPairing(bin.pa),
-            multi_language=True if bin.ml == 0 else False,
-            source_type=SourceType(bin.stype),
-            field_count=50 if bin.field_count == 1 else 60,
-            emphasis_on=True if bin.ef == 0 else False,
-            emphasis_time_constant=EmphasisTimeConstant(bin.tc),
+            locked_mode=cls.__lf_to_locked_mode[pc1 >> 7],
+            stereo_mode=cls.__sm_to_stereo_mode[pc2 >> 7],
+            audio_block_channel_count=cls.__chn_to_channel_count.get((pc2 >> 5) & 0x03),
+            audio_mode=pc2 & 0x0F,
+            audio_block_pairing=cls.__pa_to_audio_block_pairing[(pc2 >> 4) & 0x01],
+            multi_language=True if pc3 & 0x40 == 0 else False,
+            source_type=SourceType(pc3 & 0x1F),
+            field_count=50 if pc3 & 0x20 != 0 else 60,
+            emphasis_on=True if pc4 & 0x80 == 0 else False,
+            emphasis_time_constant=cls.__tc_to_emphasis_time_constant[(pc4 >> 6) & 0x01],
         )
 
     def _do_to_binary(self, system: dv_file_info.DVSystem) -> bytes:
-        assert self.sample_frequency is not None
-        assert self.locked_mode is not None
-        assert self.audio_samples_per_frame is not None
-        assert self.stereo_mode is not None
-        assert self.audio_block_channel_count is not None
-        assert self.audio_block_pairing is not None
-        assert self.source_type is not None
-        assert self.emphasis_time_constant is not None
-        assert self.quantization is not None
-        struct = self._BinaryFields(
-            # PC 1
-            lf=int(self.locked_mode),
-            one_1=1,
-            af_size=(
-                self.audio_samples_per_frame
-                - self.__audio_samples_per_frame_ranges[system][self.sample_frequency][0]
-            ),
-            # PC 2
-            sm=int(self.stereo_mode),
-            chn=self.__channel_count_to_chn[self.audio_block_channel_count],
-            pa=int(self.audio_block_pairing),
-            audio_mode=self.audio_mode,
-            # PC 3
-            one_2=1,
-            ml=0 if self.multi_language else 1,
-            field_count=1 if self.field_count == 50 else 0,
-            stype=int(self.source_type),
-            # PC 4
-            ef=0 if self.emphasis_on else 1,
-            tc=int(self.emphasis_time_constant),
-            smp=self.__freq_to_smp[self.sample_frequency],
-            qu=int(self.quantization),
+        assert (  # assertion repeated from validate() to keep mypy happy
+            self.sample_frequency is not None
+            and self.locked_mode is not None
+            and self.audio_samples_per_frame is not None
+            and self.stereo_mode is not None
+            and self.audio_block_channel_count is not None
+            and self.audio_block_pairing is not None
+            and self.source_type is not None
+            and self.emphasis_time_constant is not None
+            and self.quantization is not None
+            and self.audio_mode is not None
+        )
+        af_size = (
+            self.audio_samples_per_frame
+            - self.__audio_samples_per_frame_ranges[system][self.sample_frequency][0]
+        )
+        return bytes(
+            (
+                self.pack_type,
+                # PC 1
+                (self.locked_mode << 7) | 0x40 | af_size,
+                # PC 2
+                (self.stereo_mode << 7)
+                | (self.__channel_count_to_chn[self.audio_block_channel_count] << 5)
+                | (self.audio_block_pairing << 4)
+                | self.audio_mode,
+                # PC 3
+                0x80
+                | (0 if self.multi_language else 0x40)
+                | (0x20 if self.field_count == 50 else 0)
+                | self.source_type,
+                # PC 4
+                (0 if self.emphasis_on else 0x80)
+                | (self.emphasis_time_constant << 6)
+                | (self.__freq_to_smp[self.sample_frequency] << 3)
+                | self.quantization,
+            )
         )
-        return bytes([self.pack_type, *bytes(struct)])
@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
-import ctypes
+import struct
 from dataclasses import dataclass
 from enum import IntEnum
 from fractions import Fraction
-from typing import ClassVar
+from typing import Any, Callable, ClassVar
 
 import video_tools.dv.data_util as du
 import video_tools.dv.file.info as dv_file_info
 from video_tools.typing import DataclassInstance
 
 from .base import CSVFieldMap, Pack, Type
-from .source_control import CompressionCount, CopyProtection, InputSource, SourceSituation
+from .source_control import (
+    CompressionCount,
+    CopyProtection,
+    InputSource,
+    SourceSituation,
+    _pc1_to_source_control_fields,
+    _source_control_pc1,
+)
 
 
 class AAUXRecordingMode(IntEnum):
@@ -39,7 +46,42 @@ class Direction(IntEnum):
     REVERSE = 0x0
 
 
-def __calculate_playback_speeds() -> dict[int, Fraction | None]:
+_rec_mode_to_recording_mode = tuple(
+    AAUXRecordingMode(bits) if bits in AAUXRecordingMode else None for bits in range(0x8)
+)
+_insert_ch_to_insert_channel = tuple(
+    InsertChannel(bits) if bits != 0x7 else None for bits in range(0x8)
+)
+_drf_to_direction = (Direction.REVERSE, Direction.FORWARD)
+
+# Pack type byte followed by the four data bytes as one big endian word.
+_pack_struct = struct.Struct(">BI")
+
+
+class _HashedFraction(Fraction):
+    """Fraction that computes its hash only once, when it is created.
+
+    Hashing a Fraction involves a modular inverse, and playback speeds get hashed whenever a pack
+    is used as a dict key or cache key.  The shared playback speed table holds these instead of
+    plain Fraction objects."""
+
+    __slots__ = ("_hash",)
+
+    _hash: int
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> _HashedFraction:
+        self = super().__new__(cls, *args, **kwargs)
+        self._hash = Fraction.__hash__(self)
+        return self
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return repr(Fraction(self))
+
+
+def __calculate_playback_speeds() -> tuple[Fraction | None, ...]:
     speeds: dict[int, Fraction | None] = {}
 
     # First row of playback speeds (coarse value 0) is special
@@ -58,17 +100,75 @@ def __calculate_playback_speeds() -> dict[int, Fraction | None]:
             speeds[(coarse_bits << 4) | fine_bits] = (
                 coarse_value + fine_value if coarse_bits != 0x7 or fine_bits != 0xF else None
             )
-    return speeds
+    # Every 7-bit value is populated, so a tuple indexed by the bits is cheaper than a dict.
+    assert len(speeds) == 0x80
+    return tuple(
+        _HashedFraction(speeds[bits]) if speeds[bits] is not None else None for bits in range(0x80)
+    )
 
 
 _playback_speed_bits_to_fraction = __calculate_playback_speeds()
-_playback_speed_fraction_to_bits = {f: b for b, f in _playback_speed_bits_to_fraction.items()}
+# Reverse lookup keyed by the speed itself: the table fractions precompute their hashes, and any
+# other number type that equals a table speed (such as the float 0.5) hashes the same way.  The
+# "no information" value (None) is not included.
+_playback_speed_fraction_to_bits = {
+    f: b for b, f in enumerate(_playback_speed_bits_to_fraction) if f is not None
+}
 # Makes sure every calculated fraction is unique:
-assert len(_playback_speed_bits_to_fraction) == len(_playback_speed_fraction_to_bits)
-
-ValidPlaybackSpeeds: list[Fraction] = [
-    k for k in _playback_speed_fraction_to_bits.keys() if k is not None
-]
+assert len(_playback_speed_fraction_to_bits) == len(_playback_speed_bits_to_fraction) - 1
+
+ValidPlaybackSpeeds: list[Fraction] = [f for f in _playback_speed_bits_to_fraction if f is not None]
+
+
+def _parse_playback_speed(text_value: str) -> Fraction:
+    speed = Fraction(text_value)
+    bits = _playback_speed_fraction_to_bits.get(speed)
+    if bits is None:
+        return speed
+    # Hand out the shared table instance instead, since its hash is precomputed.
+    shared_speed = _playback_speed_bits_to_fraction[bits]
+    assert shared_speed is not None
+    return shared_speed
+
+
+# Text field dispatch tables used by parse_text_value and to_text_value.  Every text field
+# has a single dataclass field of the same name, so only the conversion of a non-empty
+# value differs from field to field.  Looking the conversion up in a dict avoids walking
+# through a long match statement for every field of every pack.  Enumeration names are
+# looked up in the enumeration's member map directly, skipping EnumType.__getitem__.
+_text_value_parsers: dict[str, Callable[[str], Any]] = {
+    "copy_protection": CopyProtection._member_map_.__getitem__,
+    "source_situation": SourceSituation._member_map_.__getitem__,
+    "input_source": InputSource._member_map_.__getitem__,
+    "compression_count": CompressionCount._member_map_.__getitem__,
+    "recording_start_point": du.parse_bool,
+    "recording_end_point": du.parse_bool,
+    "recording_mode": AAUXRecordingMode._member_map_.__getitem__,
+    "insert_channel": InsertChannel._member_map_.__getitem__,
+    "genre_category": lambda text_value: int(text_value, 0),
+    "direction": Direction._member_map_.__getitem__,
+    "playback_speed": _parse_playback_speed,
+    "reserved": lambda text_value: int(text_value, 0),
+}
+# Precomputed text for the small integer and boolean fields.  Out of range integers from an
+# invalid pack still fall back to formatting the value on the fly.
+_bool_text = {False: "FALSE", True: "TRUE"}
+_genre_category_text = {value: du.hex_int(value, 2) for value in range(0x80)}
+_reserved_text = {value: du.hex_int(value, 1) for value in range(0x2)}
+_text_value_formatters: dict[str, Callable[[Any], str]] = {
+    "copy_protection": lambda value: value.name,
+    "source_situation": lambda value: value.name,
+    "input_source": lambda value: value.name,
+    "compression_count": lambda value: value.name,
+    "recording_start_point": _bool_text.__getitem__,
+    "recording_end_point": _bool_text.__getitem__,
+    "recording_mode": lambda value: value.name,
+    "insert_channel": lambda value: value.name,
+    "genre_category": lambda value: _genre_category_text.get(value) or du.hex_int(value, 2),
+    "direction": lambda value: value.name,
+    "playback_speed": str,
+    "reserved": lambda value: _reserved_text.get(value) or du.hex_int(value, 1),
+}
 
 
 # AAUX source control
@@ -78,7 +178,7 @@ def __calculate_playback_speeds() -> dict[int, Fraction | None]:
 # SMPTE 306M-2002 7.4.2 AAUX source control pack (ASC), which is yet still different from the draft
 # copy of SMPTE 314M I was able to locate.  This structure may need some updates if someone
 # reconciles it with a newer/final copy of the SMPTE standards and/or some real-life DV files.
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AAUXSourceControl(Pack):
     # Copy protection
     copy_protection: CopyProtection | None = None
@@ -172,233 +272,154 @@ class ReservedFields:
         "reserved": ReservedFields,
     }
 
+    # Required fields and the message reported when each one is missing, in the order
+    # they are checked.
+    __required_fields: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("copy_protection", "Copy protection status is required."),
+        ("recording_start_point", "Recording start point is required."),
+        ("recording_end_point", "Recording end point is required."),
+        ("recording_mode", "Recording mode is required."),
+        ("genre_category", "Genre category is required."),
+        ("direction", "Direction field is required."),
+        ("reserved", "Reserved field is required."),
+    )
+
     def validate(self, system: dv_file_info.DVSystem) -> str | None:
-        if self.copy_protection is None:
-            return "Copy protection status is required."
-
-        if self.recording_start_point is None:
-            return "Recording start point is required."
-        if self.recording_end_point is None:
-            return "Recording end point is required."
-        if self.recording_mode is None:
-            return "Recording mode is required."
-        if self.genre_category is None:
-            return "Genre category is required."
-        if self.genre_category < 0 or self.genre_category > 0x7F:
-            return "Genre category is out of range."
+        # Fast path: one containment check covers the usual case where every required
+        # field is present; only go looking for the missing field when that fails.
+        if None in (
+            self.copy_protection,
+            self.recording_start_point,
+            self.recording_end_point,
+            self.recording_mode,
+            self.genre_category,
+            self.direction,
+            self.reserved,
+        ):
+            for field_name, message in self.__required_fields:
+                if getattr(self, field_name) is None:
+                    return message
+        assert (  # assertion repeated from above to keep mypy happy
+            self.genre_category is not None and self.reserved is not None
+        )
 
-        if self.direction is None:
-            return "Direction field is required."
-        if self.playback_speed not in _playback_speed_fraction_to_bits:
+        if not 0 <= self.genre_category <= 0x7F:
+            return "Genre category is out of range."
+        if (
+            self.playback_speed is not None
+            and self.playback_speed not in _playback_speed_fraction_to_bits
+        ):
             return "Unsupported playback speed selected.  Only certain fractional values allowed."
-
-        if self.reserved is None:
-            return "Reserved field is required."
-        if self.reserved < 0 or self.reserved > 0x1:
+        if not 0 <= self.reserved <= 0x1:
             return "Reserved field is out of range."
 
         return None
 
+    @classmethod
+    def parse_text_values(cls, text_field_values: dict[str | None, str]) -> AAUXSourceControl:
+        # Every text field maps straight onto the pack field of the same name, so skip building
+        # and then unpacking the intermediate dataclass that parse_text_value returns.
+        parsed_values: dict[str, Any] = {}
+        for text_field, text_value in text_field_values.items():
+            assert text_field is not None
+            parsed_values[text_field] = (
+                _text_value_parsers[text_field](text_value) if text_value else None
+            )
+        return cls(**parsed_values)
+
     @classmethod
     def parse_text_value(cls, text_field: str | None, text_value: str) -> DataclassInstance:
-        match text_field:
-            case "copy_protection":
-                return cls.CopyProtectionFields(
-                    copy_protection=CopyProtection[text_value] if text_value else None
-                )
-            case "source_situation":
-                return cls.SourceSituationFields(
-                    source_situation=SourceSituation[text_value] if text_value else None
-                )
-            case "input_source":
-                return cls.InputSourceFields(
-                    input_source=InputSource[text_value] if text_value else None
-                )
-            case "compression_count":
-                return cls.CompressionCountFields(
-                    compression_count=CompressionCount[text_value] if text_value else None
-                )
-            case "recording_start_point":
-                return cls.RecordingStartPointFields(
-                    recording_start_point=du.parse_bool(text_value) if text_value else None
-                )
-            case "recording_end_point":
-                return cls.RecordingEndPointFields(
-                    recording_end_point=du.parse_bool(text_value) if text_value else None
-                )
-            case "recording_mode":
-                return cls.RecordingModeFields(
-                    recording_mode=AAUXRecordingMode[text_value] if text_value else None
-                )
-            case "insert_channel":
-                return cls.InsertChannelFields(
-                    insert_channel=InsertChannel[text_value] if text_value else None
-                )
-            case "genre_category":
-                return cls.GenreCategoryFields(
-                    genre_category=int(text_value, 0) if text_value else None
-                )
-            case "direction":
-                return cls.DirectionFields(direction=Direction[text_value] if text_value else None)
-            case "playback_speed":
-                return cls.PlaybackSpeedFields(
-                    playback_speed=Fraction(text_value) if text_value else None
-                )
-            case "reserved":
-                return cls.ReservedFields(reserved=int(text_value, 0) if text_value else None)
-            case _:
-                assert False
+        assert text_field is not None
+        return cls.text_fields[text_field](
+            **{text_field: _text_value_parsers[text_field](text_value) if text_value else None}
+        )
 
     @classmethod
     def to_text_value(cls, text_field: str | None, value_subset: DataclassInstance) -> str:
-        match text_field:
-            case "copy_protection":
-                assert isinstance(value_subset, cls.CopyProtectionFields)
-                return (
-                    value_subset.copy_protection.name
-                    if value_subset.copy_protection is not None
-                    else ""
-                )
-            case "source_situation":
-                assert isinstance(value_subset, cls.SourceSituationFields)
-                return (
-                    value_subset.source_situation.name
-                    if value_subset.source_situation is not None
-                    else ""
-                )
-            case "input_source":
-                assert isinstance(value_subset, cls.InputSourceFields)
-                return (
-                    value_subset.input_source.name if value_subset.input_source is not None else ""
-                )
-            case "compression_count":
-                assert isinstance(value_subset, cls.CompressionCountFields)
-                return (
-                    value_subset.compression_count.name
-                    if value_subset.compression_count is not None
-                    else ""
-                )
-            case "recording_start_point":
-                assert isinstance(value_subset, cls.RecordingStartPointFields)
-                return (
-                    str(value_subset.recording_start_point).upper()
-                    if value_subset.recording_start_point is not None
-                    else ""
-                )
-            case "recording_end_point":
-                assert isinstance(value_subset, cls.RecordingEndPointFields)
-                return (
-                    str(value_subset.recording_end_point).upper()
-                    if value_subset.recording_end_point is not None
-                    else ""
-                )
-            case "recording_mode":
-                assert isinstance(value_subset, cls.RecordingModeFields)
-                return (
-                    value_subset.recording_mode.name
-                    if value_subset.recording_mode is not None
-                    else ""
-                )
-            case "insert_channel":
-                assert isinstance(value_subset, cls.InsertChannelFields)
-                return (
-                    value_subset.insert_channel.name
-                    if value_subset.insert_channel is not None
-                    else ""
-                )
-            case "genre_category":
-                assert isinstance(value_subset, cls.GenreCategoryFields)
-                return (
-                    du.hex_int(value_subset.genre_category, 2)
-                    if value_subset.genre_category is not None
-                    else ""
-                )
-            case "direction":
-                assert isinstance(value_subset, cls.DirectionFields)
-                return value_subset.direction.name if value_subset.direction is not None else ""
-            case "playback_speed":
-                assert isinstance(value_subset, cls.PlaybackSpeedFields)
-                return (
-                    str(value_subset.playback_speed)
-                    if value_subset.playback_speed is not None
-                    else ""
-                )
-            case "reserved":
-                assert isinstance(value_subset, cls.ReservedFields)
-                return (
-                    du.hex_int(value_subset.reserved, 1)
-                    if value_subset.reserved is not None
-                    else ""
-                )
-            case _:
-                assert False
-
-    class _BinaryFields(ctypes.BigEndianStructure):
-        _pack_ = 1
-        _fields_: ClassVar = [
-            # PC 1
-            ("cgms", ctypes.c_uint8, 2),
-            ("isr", ctypes.c_uint8, 2),
-            ("cmp", ctypes.c_uint8, 2),
-            ("ss", ctypes.c_uint8, 2),
-            # PC 2
-            ("rec_st", ctypes.c_uint8, 1),
-            ("rec_end", ctypes.c_uint8, 1),
-            ("rec_mode", ctypes.c_uint8, 3),
-            ("insert_ch", ctypes.c_uint8, 3),
-            # PC 3
-            ("drf", ctypes.c_uint8, 1),
-            ("speed", ctypes.c_uint8, 7),
-            # PC 4
-            ("one", ctypes.c_uint8, 1),
-            ("genre_category", ctypes.c_uint8, 7),
-        ]
+        assert text_field is not None
+        assert type(value_subset) is cls.text_fields[text_field]
+        value = getattr(value_subset, text_field)
+        return _text_value_formatters[text_field](value) if value is not None else ""
+
+    # Binary layout of the pack data bytes, from the most significant bit to the least:
+    #   PC 1: CGMS (2 bits), ISR (2 bits), CMP (2 bits), SS (2 bits)
+    #   PC 2: REC ST (1 bit), REC END (1 bit), REC MODE (3 bits), INSERT CH (3 bits)
+    #   PC 3: DRF (1 bit), SPEED (7 bits)
+    #   PC 4: reserved, normally 1 (1 bit), GENRE CATEGORY (7 bits)
+    #
+    # The fields are unpacked with plain shifts and masks, which is much faster than going
+    # through a ctypes bit field structure.
 
     pack_type = Type.AAUX_SOURCE_CONTROL
 
+    # The recording mode is the only field that can decode to an invalid value, and the parser
+    # rejects that itself.
+    _parsed_packs_are_valid = True
+
     @classmethod
     def _do_parse_binary(
         cls, pack_bytes: bytes, system: dv_file_info.DVSystem
     ) -> AAUXSourceControl | None:
         # Unpack fields from bytes.
-        bin = cls._BinaryFields.from_buffer_copy(pack_bytes, 1)
+        pc1, pc2, pc3, pc4 = pack_bytes[1], pack_bytes[2], pack_bytes[3], pack_bytes[4]
+        recording_mode = _rec_mode_to_recording_mode[(pc2 >> 3) & 0x07]
+        if recording_mode is None:
+            return None
+        copy_protection, input_source, compression_count, source_situation = (
+            _pc1_to_source_control_fields[pc1]
+        )
         return cls(
-            copy_protection=CopyProtection(bin.cgms),
-            source_situation=SourceSituation(bin.ss) if bin.ss != 0x3 else None,
-            input_source=InputSource(bin.isr) if bin.isr != 0x3 else None,
-            compression_count=CompressionCount(bin.cmp) if bin.cmp != 0x3 else None,
-            recording_start_point=True if bin.rec_st == 0 else False,
-            recording_end_point=True if bin.rec_end == 0 else False,
-            recording_mode=(
-                AAUXRecordingMode(bin.rec_mode) if bin.rec_mode in AAUXRecordingMode else None
-            ),
-            insert_channel=InsertChannel(bin.insert_ch) if bin.insert_ch != 0x7 else None,
-            genre_category=bin.genre_category,
-            direction=Direction(bin.drf),
-            playback_speed=_playback_speed_bits_to_fraction[bin.speed],
-            reserved=bin.one,
+            copy_protection=copy_protection,
+            source_situation=source_situation,
+            input_source=input_source,
+            compression_count=compression_count,
+            recording_start_point=True if pc2 & 0x80 == 0 else False,
+            recording_end_point=True if pc2 & 0x40 == 0 else False,
+            recording_mode=recording_mode,
+            insert_channel=_insert_ch_to_insert_channel[pc2 & 0x07],
+            genre_category=pc4 & 0x7F,
+            direction=_drf_to_direction[pc3 >> 7],
+            playback_speed=_playback_speed_bits_to_fraction[pc3 & 0x7F],
+            reserved=pc4 >> 7,
         )
 
     def _do_to_binary(self, system: dv_file_info.DVSystem) -> bytes:
-        assert self.copy_protection is not None
-        assert self.recording_mode is not None
-        assert self.direction is not None
-        struct = self._BinaryFields(
+        assert (  # assertion repeated from validate() to keep mypy happy
+            self.copy_protection is not None
+            and self.recording_mode is not None
+            and self.genre_category is not None
+            and self.direction is not None
+            and self.reserved is not None
+        )
+        pc1 = _source_control_pc1(
+            self.copy_protection,
+            self.input_source,
+            self.compression_count,
+            self.source_situation,
+        )
+        rec_st = 0 if self.recording_start_point else 1
+        rec_end = 0 if self.recording_end_point else 1
+        rec_mode = int(self.recording_mode)
+        insert_ch = int(self.insert_channel) if self.insert_channel is not None else 0x7
+        drf = int(self.direction)
+        speed = (
+            _playback_speed_fraction_to_bits[self.playback_speed]
+            if self.playback_speed is not None
+            else 0x7F
+        )
+        return _pack_struct.pack(
+            self.pack_type,
             # PC 1
-            cgms=int(self.copy_protection),
-            isr=int(self.input_source) if self.input_source is not None else 0x3,
-            cmp=int(self.compression_count) if self.compression_count is not None else 0x3,
-            ss=int(self.source_situation) if self.source_situation is not None else 0x3,
+            (pc1 << 24)
             # PC 2
-            rec_st=0 if self.recording_start_point else 1,
-            rec_end=0 if self.recording_end_point else 1,
-            rec_mode=int(self.recording_mode),
-            insert_ch=int(self.insert_channel) if self.insert_channel is not None else 0x7,
+            | (rec_st << 23)
+            | (rec_end << 22)
+            | (rec_mode << 19)
+            | (insert_ch << 16)
             # PC 3
-            drf=int(self.direction),
-            speed=_playback_speed_fraction_to_bits[self.playback_speed],
+            | (drf << 15)
+            | (speed << 8)
             # PC 4
-            one=self.reserved,
-            genre_category=self.genre_category,
+            | (self.reserved << 7)
+            | self.genre_category,
         )
-        return bytes([self.pack_type, *bytes(struct)])
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import functools
 from abc import ABC, abstractmethod
-from dataclasses import asdict, dataclass, fields
+from dataclasses import dataclass, fields
 from enum import IntEnum
-from typing import Any, ClassVar
+from typing import Any, ClassVar, Sequence
+
+import numpy as np
+import numpy.typing as npt
 
 import video_tools.dv.file.info as dv_file_info
 from video_tools.typing import DataclassInstance
@@ -78,7 +82,7 @@ class Type(IntEnum):
 CSVFieldMap = dict[str | None, type[DataclassInstance]]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Pack(ABC):
     @abstractmethod
     def validate(self, system: dv_file_info.DVSystem) -> str | None:
@@ -92,6 +96,21 @@ def validate(self, system: dv_file_info.DVSystem) -> str | None:
         """
         pass
 
+    @staticmethod
+    def validate_batch(
+        packs: Sequence[Pack], system: dv_file_info.DVSystem
+    ) -> npt.NDArray[np.bool_]:
+        """Validate many packs at once, returning a mask that is True for each valid pack.
+
+        The packs can be of different types.  Bulk imports repeat the same few pack values many
+        times over, so each distinct pack is validated only once.
+        """
+        results: dict[Pack, bool] = {}
+        for pack in packs:
+            if pack not in results:
+                results[pack] = pack.validate(system) is None
+        return np.fromiter((results[pack] for pack in packs), dtype=np.bool_, count=len(packs))
+
     # Abstract functions for converting subsets of pack values to/from strings suitable for use
     # in a CSV file or other configuration files.  Pack value subsets are a dataclass object whose
     # field values must match the field values defined in the main dataclass.
@@ -105,6 +124,27 @@ def validate(self, system: dv_file_info.DVSystem) -> str | None:
     #     field name of 'blank_flag' --> sc_smpte_timecode_blank_flag
     text_fields: ClassVar[CSVFieldMap]
 
+    # Precomputed from text_fields when each subclass is created: each text field name, its
+    # dataclass type, and the names of the pack fields that go into that dataclass.  This
+    # saves the text conversion functions from looking up the dataclass fields again for every
+    # pack.
+    _text_field_subsets: ClassVar[
+        tuple[tuple[str | None, type[DataclassInstance], tuple[str, ...]], ...]
+    ] = ()
+    _text_field_names: ClassVar[dict[str | None, tuple[str, ...]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super(Pack, cls).__init_subclass__(**kwargs)
+        text_fields: CSVFieldMap | None = getattr(cls, "text_fields", None)
+        if text_fields is not None:
+            cls._text_field_subsets = tuple(
+                (text_field, typ, tuple(field.name for field in fields(typ)))
+                for text_field, typ in text_fields.items()
+            )
+            cls._text_field_names = {
+                text_field: field_names for text_field, _, field_names in cls._text_field_subsets
+            }
+
     @classmethod
     @abstractmethod
     def parse_text_value(cls, text_field: str | None, text_value: str) -> DataclassInstance:
@@ -127,9 +167,10 @@ def value_subset_for_text_field(self, text_field: str | None) -> DataclassInstan
 
         The returned keys must match with keyword arguments in the initializer."""
         typ = self.text_fields[text_field]
-        full_dict = asdict(self)
-        subset_dict = {field.name: full_dict[field.name] for field in fields(typ)}
-        return typ(**subset_dict)
+        # Read the attributes directly: asdict() would recursively copy every field of the
+        # pack just to pick out a few of them.  The field names were collected once, when the
+        # class was created.
+        return typ(**{name: getattr(self, name) for name in self._text_field_names[text_field]})
 
     # Functions for converting all pack values to/from multiple CSV file fields.
 
@@ -139,25 +180,31 @@ def parse_text_values(cls, text_field_values: dict[str | None, str]) -> Pack:
 
         Any missing field values will be assumed to have a value of the empty string.
         """
-        parsed_values: dict[str, Any] = {}
+        init_kwargs: dict[str, Any] = {}
         for text_field, text_value in text_field_values.items():
-            parsed_values |= asdict(cls.parse_text_value(text_field, text_value))
-        return cls(**parsed_values)
+            value_subset = cls.parse_text_value(text_field, text_value)
+            for name in cls._text_field_names[text_field]:
+                init_kwargs[name] = getattr(value_subset, name)
+        return cls(**init_kwargs)
 
     def to_text_values(self) -> dict[str | None, str]:
         """Convert the pack field values to text fields."""
-        result = {}
-        for text_field in self.text_fields.keys():
-            result[text_field] = self.to_text_value(
-                text_field, self.value_subset_for_text_field(text_field)
+        return {
+            text_field: self.to_text_value(
+                text_field, typ(**{name: getattr(self, name) for name in field_names})
             )
-        return result
+            for text_field, typ, field_names in self._text_field_subsets
+        }
 
     # Functions for going to/from binary packs
 
     # Binary byte value for the pack type header.
     pack_type: ClassVar[Type]
 
+    # Subclasses can set this if _do_parse_binary already returns None for every input that
+    # would fail validation.  parse_binary then skips the redundant validate() call.
+    _parsed_packs_are_valid: ClassVar[bool] = False
+
     @classmethod
     @abstractmethod
     def _do_parse_binary(cls, pack_bytes: bytes, system: dv_file_info.DVSystem) -> Pack | None:
@@ -176,8 +223,24 @@ def parse_binary(cls, pack_bytes: bytes, system: dv_file_info.DVSystem) -> Pack
         """
         assert len(pack_bytes) == 5
         assert pack_bytes[0] == cls.pack_type
-        pack = cls._do_parse_binary(pack_bytes, system)
-        return pack if pack is not None and pack.validate(system) is None else None
+        return _parse_binary_cached(cls, bytes(pack_bytes), system)
+
+    @classmethod
+    def parse_binary_batch(
+        cls, packs: npt.NDArray[np.uint8], system: dv_file_info.DVSystem
+    ) -> list[Pack | None]:
+        """Parse many binary packs of this type at once.
+
+        The input array is expected to have a shape of (N, 5), with one pack per row.  A DV file
+        repeats the same few packs over and over, so each distinct row is parsed only once and the
+        resulting instances are shared.
+        """
+        assert packs.ndim == 2 and packs.shape[1] == 5
+        if len(packs) == 0:
+            return []
+        unique_packs, inverse = np.unique(packs, axis=0, return_inverse=True)
+        parsed = [cls.parse_binary(row.tobytes(), system) for row in unique_packs]
+        return [parsed[i] for i in inverse.ravel().tolist()]
 
     @abstractmethod
     def _do_to_binary(self, system: dv_file_info.DVSystem) -> bytes:
@@ -186,10 +249,45 @@ def _do_to_binary(self, system: dv_file_info.DVSystem) -> bytes:
 
     def to_binary(self, system: dv_file_info.DVSystem) -> bytes:
         """Convert this pack to the 5 byte binary format."""
-        validation_message = self.validate(system)
-        if validation_message is not None:
-            raise ValidationError(validation_message)
-        b = self._do_to_binary(system)
-        assert len(b) == 5
-        assert b[0] == self.pack_type
-        return b
+        return _to_binary_cached(self, system)
+
+    @staticmethod
+    def to_binary_batch(
+        packs: Sequence[Pack], system: dv_file_info.DVSystem
+    ) -> npt.NDArray[np.uint8]:
+        """Convert many packs to binary at once.
+
+        The packs can be of different types.  Returns an array with a shape of (N, 5), with one
+        pack per row.  Each distinct pack is validated and encoded only once, and all the results
+        are joined in a single pass.
+        """
+        encoded = bytearray().join([_to_binary_cached(pack, system) for pack in packs])
+        # Joining into a bytearray gives the caller a writable array without another copy.
+        return np.frombuffer(encoded, dtype=np.uint8).reshape(-1, 5)
+
+
+# The same handful of pack values tends to repeat across a great many frames of a DV file, so
+# conversions to/from binary are memoized.  Packs are immutable, so it's safe to hand out the same
+# parsed instance more than once.
+_BINARY_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=_BINARY_CACHE_SIZE)
+def _parse_binary_cached(
+    cls: type[Pack], pack_bytes: bytes, system: dv_file_info.DVSystem
+) -> Pack | None:
+    pack = cls._do_parse_binary(pack_bytes, system)
+    if pack is None or cls._parsed_packs_are_valid:
+        return pack
+    return pack if pack.validate(system) is None else None
+
+
+@functools.lru_cache(maxsize=_BINARY_CACHE_SIZE)
+def _to_binary_cached(pack: Pack, system: dv_file_info.DVSystem) -> bytes:
+    validation_message = pack.validate(system)
+    if validation_message is not None:
+        raise ValidationError(validation_message)
+    b = pack._do_to_binary(system)
+    assert len(b) == 5
+    assert b[0] == pack.pack_type
+    return b
@@ -8,19 +8,24 @@ class FocusMode(IntEnum):
     MANUAL = 0x1
 
 
-def __calculate_focus_positions() -> dict[int, int | None]:
-    focus: dict[int, int | None] = {}
+def __calculate_focus_positions() -> tuple[int | None, ...]:
+    focus: list[int | None] = []
     for bits in range(0x00, 0x7E + 1):
-        focus[bits] = (bits >> 2) * (10 ** (bits & 0x03))
-    focus[0x7F] = None
-    return focus
+        focus.append((bits >> 2) * (10 ** (bits & 0x03)))
+    focus.append(None)  # 0x7F: no information
+    return tuple(focus)
 
 
 _focus_position_bits_to_length = __calculate_focus_positions()
+# The no information sentinel is left out of the reverse lookup: encoders check for None first,
+# just like the other optional fields.
 _focus_position_length_to_bits = {
-    ln: b for b, ln in reversed(list(_focus_position_bits_to_length.items()))
+    ln: b for b, ln in reversed(list(enumerate(_focus_position_bits_to_length))) if ln is not None
 }
 # NOTE: we don't expect that every calculated focus value is unique: there are multiple ways to
 # represent zero.  The items list above is reversed so that LSBs are also zero when MSBs are zero.
 
-ValidFocusPositions: list[int] = [k for k in _focus_position_length_to_bits.keys() if k is not None]
+# Membership tests in validate() go through a frozen set of the valid values.
+_focus_position_valid_lengths = frozenset(_focus_position_length_to_bits)
+
+ValidFocusPositions: list[int] = list(_focus_position_length_to_bits)
@@ -2,38 +2,52 @@
 
 from __future__ import annotations
 
-import ctypes
 from dataclasses import dataclass
 from enum import IntEnum
-from typing import ClassVar
+from typing import Any, Callable, ClassVar
 
 import video_tools.dv.data_util as du
 import video_tools.dv.file.info as dv_file_info
 from video_tools.typing import DataclassInstance
 
 from .base import CSVFieldMap, Pack, Type
-from .camera import FocusMode, _focus_position_bits_to_length, _focus_position_length_to_bits
+from .camera import (
+    FocusMode,
+    _focus_position_bits_to_length,
+    _focus_position_length_to_bits,
+    _focus_position_valid_lengths,
+)
 
 _iris_digits = 1  # number of decimals to round to for the iris
 
 
-def __calculate_iris_f_numbers() -> dict[int, float | None]:
-    iris: dict[int, float | None] = {}
+def __calculate_iris_f_numbers() -> tuple[float | None, ...]:
+    iris: list[float | None] = []
     for bits in range(0x00, 0x3C + 1):
-        iris[bits] = round(2 ** (float(bits) / 8.0), _iris_digits)
-    iris[0x3D] = 0.0
-    iris[0x3E] = 999.9
-    iris[0x3F] = None
-    return iris
+        iris.append(round(2 ** (float(bits) / 8.0), _iris_digits))
+    iris.append(0.0)  # 0x3D: under F1.0
+    iris.append(999.9)  # 0x3E: closed
+    iris.append(None)  # 0x3F: no information
+    return tuple(iris)
 
 
 _iris_bits_to_f_number = __calculate_iris_f_numbers()
-_iris_f_number_to_bits = {f: b for b, f in _iris_bits_to_f_number.items()}
+_iris_f_number_to_bits = {f: b for b, f in enumerate(_iris_bits_to_f_number) if f is not None}
 # Makes sure every calculated iris value is unique - ensures that we didn't round F number
 # too much to ambiguity:
-assert len(_iris_bits_to_f_number) == len(_iris_f_number_to_bits)
+assert len(_iris_f_number_to_bits) == len(_iris_bits_to_f_number) - 1
 
-ValidConsumerIrisFNumbers: list[float] = [k for k in _iris_f_number_to_bits.keys() if k is not None]
+
+def _iris_bits(iris: float) -> int | None:
+    """Returns the bits for an F number, or None if it is not a supported value.
+
+    F numbers are usually exactly one of the table values already, so that is checked first
+    before rounding to the table's precision."""
+    bits = _iris_f_number_to_bits.get(iris)
+    return bits if bits is not None else _iris_f_number_to_bits.get(round(iris, _iris_digits))
+
+
+ValidConsumerIrisFNumbers: list[float] = [f for f in _iris_bits_to_f_number if f is not None]
 
 
 class AutoExposureMode(IntEnum):
@@ -98,34 +112,61 @@ class WhiteBalance(IntEnum):
     RESERVED_30 = 0x1E
 
 
+# Decoding tables indexed by the raw bits, with the no information sentinel mapping to None.
+_auto_exposure_mode_bits_to_mode = tuple(
+    AutoExposureMode(bits) if bits != 0xF else None for bits in range(0x10)
+)
+_auto_gain_control_bits_to_value = tuple(bits if bits != 0xF else None for bits in range(0x10))
+_white_balance_mode_bits_to_mode = tuple(
+    WhiteBalanceMode(bits) if bits != 0x7 else None for bits in range(0x8)
+)
+_white_balance_bits_to_white_balance = tuple(
+    WhiteBalance(bits) if bits != 0x1F else None for bits in range(0x20)
+)
+
+
 class PanningDirection(IntEnum):
     SAME_DIRECTION_AS_SCANNING = 0x0
     OPPOSITE_DIRECTION_OF_SCANNING = 0x1
 
 
-def __calculate_focal_lengths() -> dict[int, int | None]:
-    focal_length: dict[int, int | None] = {}
+# Panning speed decoding tables indexed by the raw bits.  The horizontal speed is stored in units
+# of two pixels per field, so the doubling is folded into its table.
+_vertical_panning_speed_bits_to_speed = tuple(
+    bits if bits != 0x1F else None for bits in range(0x20)
+)
+_horizontal_panning_speed_bits_to_speed = tuple(
+    bits * 2 if bits != 0x3F else None for bits in range(0x40)
+)
+
+
+def __calculate_focal_lengths() -> tuple[int | None, ...]:
+    focal_length: list[int | None] = []
     for bits in range(0, 0xFF):
         msb = bits >> 1
         lsb = bits & 0x1
-        focal_length[bits] = msb * (10**lsb)
-    focal_length[0xFF] = None
-    return focal_length
+        focal_length.append(msb * (10**lsb))
+    focal_length.append(None)  # 0xFF: no information
+    return tuple(focal_length)
 
 
 _focal_length_bits_to_millimeters = __calculate_focal_lengths()
 _focal_length_millimeters_to_bits = {
-    m: b for b, m in reversed(list(_focal_length_bits_to_millimeters.items()))
+    m: b for b, m in reversed(list(enumerate(_focal_length_bits_to_millimeters)))
 }
 # NOTE: we don't expect that every calculated focus value is unique: there are multiple ways to
 # represent zero.  The items list above is reversed so that LSBs are also zero when MSBs are zero.
 
+_focal_length_valid_millimeters = frozenset(
+    m for m in _focal_length_millimeters_to_bits if m is not None
+)
+
 ValidFocalLengths: list[int] = [
     k for k in _focal_length_millimeters_to_bits.keys() if k is not None
 ]
 
 
-_electric_zoom_digits = 1  # number of decimals to round to for the iris
+_electric_zoom_digits = 1  # number of decimals to round to for the electric zoom
 
 
 def __calculate_electric_zoom_magnifications() -> dict[int, float | None]:
@@ -138,21 +179,82 @@ def __calculate_electric_zoom_magnifications() -> dict[int, float | None]:
     return electric_zoom_magnification
 
 
-_electric_zoom_bits_to_magnification = __calculate_electric_zoom_magnifications()
+_electric_zoom_magnifications = __calculate_electric_zoom_magnifications()
 _electric_zoom_magnification_to_bits = {
-    m: b for b, m in _electric_zoom_bits_to_magnification.items()
+    m: b for b, m in _electric_zoom_magnifications.items() if m is not None
 }
 # Makes sure every calculated magnification value is unique
-assert len(_electric_zoom_bits_to_magnification) == len(_electric_zoom_magnification_to_bits)
+assert len(_electric_zoom_magnifications) - 1 == len(_electric_zoom_magnification_to_bits)
+# Not every 7-bit value is a valid encoding, so decoding checks against the set of valid bits
+# before indexing the tuple.
+_electric_zoom_valid_bits = frozenset(_electric_zoom_magnifications)
+_electric_zoom_bits_to_magnification = tuple(
+    _electric_zoom_magnifications.get(bits) for bits in range(0x80)
+)
+
+
+def _electric_zoom_bits(electric_zoom_magnification: float) -> int | None:
+    """Returns the bits for a magnification, or None if it is not a supported value.
+
+    As with the iris, the exact value is looked up before rounding to the table's precision."""
+    bits = _electric_zoom_magnification_to_bits.get(electric_zoom_magnification)
+    return (
+        bits
+        if bits is not None
+        else _electric_zoom_magnification_to_bits.get(
+            round(electric_zoom_magnification, _electric_zoom_digits)
+        )
+    )
+
 
 ValidElectricZoomMagnifications: list[float] = [
-    k for k in _electric_zoom_magnification_to_bits.keys() if k is not None
+    m for m in _electric_zoom_magnifications.values() if m is not None
 ]
 
 
+def _enum_names(enum_type: type[IntEnum]) -> tuple[str, ...]:
+    names = tuple(member.name for member in sorted(enum_type))
+    assert all(member == value for value, member in enumerate(sorted(enum_type)))
+    return names
+
+
+# Member names are looked up in tuples indexed by the member value: Enum.name is a Python-level
+# property, which costs much more than indexing.  Every enumeration here has contiguous values
+# starting from zero.
+_auto_exposure_mode_names = _enum_names(AutoExposureMode)
+_white_balance_mode_names = _enum_names(WhiteBalanceMode)
+_white_balance_names = _enum_names(WhiteBalance)
+_focus_mode_names = _enum_names(FocusMode)
+_panning_direction_names = _enum_names(PanningDirection)
+
+
+# Text field dispatch tables used by CameraConsumer1.parse_text_value and to_text_value.  Every
+# text field has a single dataclass field of the same name, so only the conversion of a non-empty
+# value differs from field to field.  Enumeration names are looked up in the enumeration's member
+# map directly, skipping EnumType.__getitem__.
+_consumer_1_text_value_parsers: dict[str, Callable[[str], Any]] = {
+    "auto_exposure_mode": AutoExposureMode._member_map_.__getitem__,
+    "iris": float,
+    "auto_gain_control": int,
+    "white_balance_mode": WhiteBalanceMode._member_map_.__getitem__,
+    "white_balance": WhiteBalance._member_map_.__getitem__,
+    "focus_mode": FocusMode._member_map_.__getitem__,
+    "focus_position": int,
+}
+_consumer_1_text_value_formatters: dict[str, Callable[[Any], str]] = {
+    "auto_exposure_mode": _auto_exposure_mode_names.__getitem__,
+    "iris": str,
+    "auto_gain_control": str,
+    "white_balance_mode": _white_balance_mode_names.__getitem__,
+    "white_balance": _white_balance_names.__getitem__,
+    "focus_mode": _focus_mode_names.__getitem__,
+    "focus_position": str,
+}
+
+
 # Consumer camera 1
 # IEC 61834-4:1998 10.1 Consumer camera 1 (CAMERA)
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CameraConsumer1(Pack):
     auto_exposure_mode: AutoExposureMode | None = None
     # Iris is F number rounded to exactly 1 decimal places.
@@ -168,31 +270,31 @@ class CameraConsumer1(Pack):
     focus_mode: FocusMode | None = None
     focus_position: int | None = None  # length in centimeters
 
-    @dataclass(frozen=True, kw_only=True)
+    @dataclass(frozen=True, kw_only=True, slots=True)
     class AutoExposureModeFields:
         auto_exposure_mode: AutoExposureMode | None
 
-    @dataclass(frozen=True, kw_only=True)
+    @dataclass(frozen=True, kw_only=True, slots=True)
     class IrisFields:
         iris: float | None
 
-    @dataclass(frozen=True, kw_only=True)
+    @dataclass(frozen=True, kw_only=True, slots=True)
     class AutoGainControlFields:
         auto_gain_control: int | None
 
-    @dataclass(frozen=True, kw_only=True)
+    @dataclass(frozen=True, kw_only=True, slots=True)
     class WhiteBalanceModeFields:
         white_balance_mode: WhiteBalanceMode | None
 
-    @dataclass(frozen=True, kw_only=True)
+    @dataclass(frozen=True, kw_only=True, slots=True)
     class WhiteBalanceFields:
         white_balance: WhiteBalance | None
 
-    @dataclass(frozen=True, kw_only=True)
+    @dataclass(frozen=True, kw_only=True, slots=True)
     class FocusModeFields:
         focus_mode: FocusMode | None
 
-    @dataclass(frozen=True, kw_only=True)
+    @dataclass(frozen=True, kw_only=True, slots=True)
     class FocusPositionFields:
         focus_position: int | None
 
@@ -207,7 +309,7 @@ class FocusPositionFields:
     }
 
     def validate(self, system: dv_file_info.DVSystem) -> str | None:
-        if self.iris is not None and round(self.iris, _iris_digits) not in _iris_f_number_to_bits:
+        if self.iris is not None and _iris_bits(self.iris) is None:
             return "Unsupported iris value selected.  Only certain numbers are allowed."
         if self.auto_gain_control is not None and (
             self.auto_gain_control < 0 or self.auto_gain_control > 0xE
@@ -218,7 +320,7 @@ def validate(self, system: dv_file_info.DVSystem) -> str | None:
             return "Focus mode is required."
         if (
             self.focus_position is not None
-            and self.focus_position not in _focus_position_length_to_bits
+            and self.focus_position not in _focus_position_valid_lengths
         ):
             return "Unsupported focus position value selected.  Only certain numbers are allowed."
 
@@ -226,97 +328,25 @@ def validate(self, system: dv_file_info.DVSystem) -> str | None:
 
     @classmethod
     def parse_text_value(cls, text_field: str | None, text_value: str) -> DataclassInstance:
-        match text_field:
-            case "auto_exposure_mode":
-                return cls.AutoExposureModeFields(
-                    auto_exposure_mode=AutoExposureMode[text_value] if text_value else None
-                )
-            case "iris":
-                return cls.IrisFields(iris=float(text_value) if text_value else None)
-            case "auto_gain_control":
-                return cls.AutoGainControlFields(
-                    auto_gain_control=int(text_value) if text_value else None
-                )
-            case "white_balance_mode":
-                return cls.WhiteBalanceModeFields(
-                    white_balance_mode=WhiteBalanceMode[text_value] if text_value else None
-                )
-            case "white_balance":
-                return cls.WhiteBalanceFields(
-                    white_balance=WhiteBalance[text_value] if text_value else None
-                )
-            case "focus_mode":
-                return cls.FocusModeFields(focus_mode=FocusMode[text_value] if text_value else None)
-            case "focus_position":
-                return cls.FocusPositionFields(
-                    focus_position=int(text_value) if text_value else None
-                )
-            case _:
-                assert False
+        assert text_field is not None
+        if not text_value:
+            return _consumer_1_empty_text_value_subsets[text_field]
+        return cls.text_fields[text_field](
+            **{text_field: _consumer_1_text_value_parsers[text_field](text_value)}
+        )
 
     @classmethod
     def to_text_value(cls, text_field: str | None, value_subset: DataclassInstance) -> str:
-        match text_field:
-            case "auto_exposure_mode":
-                assert isinstance(value_subset, cls.AutoExposureModeFields)
-                return (
-                    value_subset.auto_exposure_mode.name
-                    if value_subset.auto_exposure_mode is not None
-                    else ""
-                )
-            case "iris":
-                assert isinstance(value_subset, cls.IrisFields)
-                return str(value_subset.iris) if value_subset.iris is not None else ""
-            case "auto_gain_control":
-                assert isinstance(value_subset, cls.AutoGainControlFields)
-                return (
-                    str(value_subset.auto_gain_control)
-                    if value_subset.auto_gain_control is not None
-                    else ""
-                )
-            case "white_balance_mode":
-                assert isinstance(value_subset, cls.WhiteBalanceModeFields)
-                return (
-                    value_subset.white_balance_mode.name
-                    if value_subset.white_balance_mode is not None
-                    else ""
-                )
-            case "white_balance":
-                assert isinstance(value_subset, cls.WhiteBalanceFields)
-                return (
-                    value_subset.white_balance.name
-                    if value_subset.white_balance is not None
-                    else ""
-                )
-            case "focus_mode":
-                assert isinstance(value_subset, cls.FocusModeFields)
-                return value_subset.focus_mode.name if value_subset.focus_mode is not None else ""
-            case "focus_position":
-                assert isinstance(value_subset, cls.FocusPositionFields)
-                return (
-                    str(value_subset.focus_position)
-                    if value_subset.focus_position is not None
-                    else ""
-                )
-            case _:
-                assert False
-
-    class _BinaryFields(ctypes.BigEndianStructure):
-        _pack_ = 1
-        _fields_: ClassVar = [
-            # PC 1
-            ("ones", ctypes.c_uint8, 2),
-            ("iris", ctypes.c_uint8, 6),
-            # PC 2
-            ("ae_mode", ctypes.c_uint8, 4),
-            ("agc", ctypes.c_uint8, 4),
-            # PC 3
-            ("wb_mode", ctypes.c_uint8, 3),
-            ("white_balance", ctypes.c_uint8, 5),
-            # PC 4
-            ("fcm", ctypes.c_uint8, 1),
-            ("focus", ctypes.c_uint8, 7),
-        ]
+        assert text_field is not None
+        assert type(value_subset) is cls.text_fields[text_field]
+        value = getattr(value_subset, text_field)
+        return _consumer_1_text_value_formatters[text_field](value) if value is not None else ""
+
+    # Binary layout of the pack data bytes, from the most significant bit to the least:
+    #   PC 1: reserved, always 1 (2 bits), IRIS (6 bits)
+    #   PC 2: AE MODE (4 bits), AGC (4 bits)
+    #   PC 3: WB MODE (3 bits), WHITE BALANCE (5 bits)
+    #   PC 4: FCM (1 bit), FOCUS (7 bits)
 
     pack_type = Type.CAMERA_CONSUMER_1
 
@@ -325,43 +355,88 @@ def _do_parse_binary(
         cls, pack_bytes: bytes, system: dv_file_info.DVSystem
     ) -> CameraConsumer1 | None:
         # Unpack fields from bytes.
-        bin = cls._BinaryFields.from_buffer_copy(pack_bytes, 1)
-        if bin.ones != 0x3:
+        pc1, pc2, pc3, pc4 = pack_bytes[1], pack_bytes[2], pack_bytes[3], pack_bytes[4]
+        if pc1 >> 6 != 0x3:
             return None
         return cls(
-            auto_exposure_mode=AutoExposureMode(bin.ae_mode) if bin.ae_mode != 0xF else None,
-            iris=_iris_bits_to_f_number[bin.iris],
-            auto_gain_control=bin.agc if bin.agc != 0xF else None,
-            white_balance_mode=WhiteBalanceMode(bin.wb_mode) if bin.wb_mode != 0x7 else None,
-            white_balance=WhiteBalance(bin.white_balance) if bin.white_balance != 0x1F else None,
-            focus_mode=FocusMode(bin.fcm),
-            focus_position=_focus_position_bits_to_length[bin.focus],
+            auto_exposure_mode=_auto_exposure_mode_bits_to_mode[pc2 >> 4],
+            iris=_iris_bits_to_f_number[pc1 & 0x3F],
+            auto_gain_control=_auto_gain_control_bits_to_value[pc2 & 0x0F],
+            white_balance_mode=_white_balance_mode_bits_to_mode[pc3 >> 5],
+            white_balance=_white_balance_bits_to_white_balance[pc3 & 0x1F],
+            focus_mode=FocusMode(pc4 >> 7),
+            focus_position=_focus_position_bits_to_length[pc4 & 0x7F],
         )
 
     def _do_to_binary(self, system: dv_file_info.DVSystem) -> bytes:
-        assert self.focus_mode is not None
-        struct = self._BinaryFields(
-            # PC 1
-            ones=0x3,
-            iris=_iris_f_number_to_bits[
-                round(self.iris, _iris_digits) if self.iris is not None else None
-            ],
-            # PC 2
-            ae_mode=int(self.auto_exposure_mode) if self.auto_exposure_mode is not None else 0xF,
-            agc=self.auto_gain_control if self.auto_gain_control is not None else 0xF,
-            # PC 3
-            wb_mode=int(self.white_balance_mode) if self.white_balance_mode is not None else 0x7,
-            white_balance=int(self.white_balance) if self.white_balance is not None else 0x1F,
-            # PC 4
-            fcm=int(self.focus_mode),
-            focus=_focus_position_length_to_bits[self.focus_position],
+        # The enumerations are IntEnums, so they're used as-is: int() would only add a call per
+        # field, and .value is slower still since it's a Python-level property.
+        iris_bits = _iris_bits(self.iris) if self.iris is not None else 0x3F
+        assert iris_bits is not None  # validate() rejects unsupported F numbers
+        auto_exposure_mode = self.auto_exposure_mode
+        auto_gain_control = self.auto_gain_control
+        white_balance_mode = self.white_balance_mode
+        white_balance = self.white_balance
+        focus_mode = self.focus_mode
+        focus_position = self.focus_position
+        assert focus_mode is not None
+        return bytes(
+            (
+                self.pack_type,
+                # PC 1
+                0xC0 | iris_bits,
+                # PC 2
+                ((auto_exposure_mode if auto_exposure_mode is not None else 0xF) << 4)
+                | (auto_gain_control if auto_gain_control is not None else 0xF),
+                # PC 3
+                ((white_balance_mode if white_balance_mode is not None else 0x7) << 5)
+                | (white_balance if white_balance is not None else 0x1F),
+                # PC 4
+                (focus_mode << 7)
+                | (
+                    _focus_position_length_to_bits[focus_position]
+                    if focus_position is not None
+                    else 0x7F
+                ),
+            )
         )
-        return bytes([self.pack_type, *bytes(struct)])
+
+
+# The subset dataclasses are frozen, so every empty text value can share one subset instance per
+# text field instead of allocating a new one for each empty CSV cell.
+_consumer_1_empty_text_value_subsets = {
+    text_field: typ(**{text_field: None})
+    for text_field, typ in CameraConsumer1.text_fields.items()
+    if text_field is not None
+}
+
+
+# Text field dispatch tables used by CameraConsumer2.parse_text_value and to_text_value.
+_consumer_2_text_value_parsers: dict[str, Callable[[str], Any]] = {
+    "vertical_panning_direction": PanningDirection._member_map_.__getitem__,
+    "vertical_panning_speed": int,
+    "horizontal_panning_direction": PanningDirection._member_map_.__getitem__,
+    "horizontal_panning_speed": int,
+    "image_stabilizer_on": du.parse_bool,
+    "focal_length": int,
+    "electric_zoom_on": du.parse_bool,
+    "electric_zoom_magnification": float,
+}
+_consumer_2_text_value_formatters: dict[str, Callable[[Any], str]] = {
+    "vertical_panning_direction": _panning_direction_names.__getitem__,
+    "vertical_panning_speed": str,
+    "horizontal_panning_direction": _panning_direction_names.__getitem__,
+    "horizontal_panning_speed": str,
+    "image_stabilizer_on": lambda value: str(value).upper(),
+    "focal_length": str,
+    "electric_zoom_on": lambda value: str(value).upper(),
+    "electric_zoom_magnification": str,
+}
 
 
 # Consumer camera 2
 # IEC 61834-4:1998 10.2 Consumer camera 2 (CAMERA)
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CameraConsumer2(Pack):
     vertical_panning_direction: PanningDirection | None = None
     vertical_panning_speed: int | None = None  # lines per field; 30 means >= 30
@@ -374,35 +449,35 @@ class CameraConsumer2(Pack):
     electric_zoom_on: bool | None = None
     electric_zoom_magnification: float | None = None  # magnification factor; 8.0 means >= 8.0
 
-    @dataclass(frozen=True, kw_only=True)
+    @dataclass(frozen=True, kw_only=True, slots=True)
     class VerticalPanningDirectionFields:
         vertical_panning_direction: PanningDirection | None
 
-    @dataclass(frozen=True, kw_only=True)
+    @dataclass(frozen=True, kw_only=True, slots=True)
     class VerticalPanningSpeedFields:
         vertical_panning_speed: int | None
 
-    @dataclass(frozen=True, kw_only=True)
+    @dataclass(frozen=True, kw_only=True, slots=True)
     class HorizontalPanningDirectionFields:
         horizontal_panning_direction: PanningDirection | None
 
-    @dataclass(frozen=True, kw_only=True)
+    @dataclass(frozen=True, kw_only=True, slots=True)
     class HorizontalPanningSpeedFields:
         horizontal_panning_speed: int | None
 
-    @dataclass(frozen=True, kw_only=True)
+    @dataclass(frozen=True, kw_only=True, slots=True)
     class ImageStabilizerOnFields:
         image_stabilizer_on: bool | None
 
-    @dataclass(frozen=True, kw_only=True)
+    @dataclass(frozen=True, kw_only=True, slots=True)
     class FocalLengthFields:
         focal_length: int | None
 
-    @dataclass(frozen=True, kw_only=True)
+    @dataclass(frozen=True, kw_only=True, slots=True)
     class ElectricZoomOnFields:
         electric_zoom_on: bool | None
 
-    @dataclass(frozen=True, kw_only=True)
+    @dataclass(frozen=True, kw_only=True, slots=True)
     class ElectricZoomMagnificationFields:
         electric_zoom_magnification: float | None
 
@@ -438,15 +513,14 @@ def validate(self, system: dv_file_info.DVSystem) -> str | None:
 
         if (
             self.focal_length is not None
-            and self.focal_length not in _focal_length_millimeters_to_bits
+            and self.focal_length not in _focal_length_valid_millimeters
         ):
             return "Unsupported focal length value selected.  Only certain numbers are allowed."
         if self.electric_zoom_on is None:
             return "Electric zoom on value is required."
         if (
             self.electric_zoom_magnification is not None
-            and round(self.electric_zoom_magnification, _electric_zoom_digits)
-            not in _electric_zoom_magnification_to_bits
+            and _electric_zoom_bits(self.electric_zoom_magnification) is None
         ):
             return "Unsupported electric zoom value selected.  Only certain numbers are allowed."
 
@@ -454,119 +528,25 @@ def validate(self, system: dv_file_info.DVSystem) -> str | None:
 
     @classmethod
     def parse_text_value(cls, text_field: str | None, text_value: str) -> DataclassInstance:
-        match text_field:
-            case "vertical_panning_direction":
-                return cls.VerticalPanningDirectionFields(
-                    vertical_panning_direction=PanningDirection[text_value] if text_value else None
-                )
-            case "vertical_panning_speed":
-                return cls.VerticalPanningSpeedFields(
-                    vertical_panning_speed=int(text_value) if text_value else None
-                )
-            case "horizontal_panning_direction":
-                return cls.HorizontalPanningDirectionFields(
-                    horizontal_panning_direction=PanningDirection[text_value]
-                    if text_value
-                    else None
-                )
-            case "horizontal_panning_speed":
-                return cls.HorizontalPanningSpeedFields(
-                    horizontal_panning_speed=int(text_value) if text_value else None
-                )
-            case "image_stabilizer_on":
-                return cls.ImageStabilizerOnFields(
-                    image_stabilizer_on=du.parse_bool(text_value) if text_value else None
-                )
-            case "focal_length":
-                return cls.FocalLengthFields(focal_length=int(text_value) if text_value else None)
-            case "electric_zoom_on":
-                return cls.ElectricZoomOnFields(
-                    electric_zoom_on=du.parse_bool(text_value) if text_value else None
-                )
-            case "electric_zoom_magnification":
-                return cls.ElectricZoomMagnificationFields(
-                    electric_zoom_magnification=float(text_value) if text_value else None
-                )
-            case _:
-                assert False
+        assert text_field is not None
+        if not text_value:
+            return _consumer_2_empty_text_value_subsets[text_field]
+        return cls.text_fields[text_field](
+            **{text_field: _consumer_2_text_value_parsers[text_field](text_value)}
+        )
 
     @classmethod
     def to_text_value(cls, text_field: str | None, value_subset: DataclassInstance) -> str:
-        match text_field:
-            case "vertical_panning_direction":
-                assert isinstance(value_subset, cls.VerticalPanningDirectionFields)
-                return (
-                    value_subset.vertical_panning_direction.name
-                    if value_subset.vertical_panning_direction is not None
-                    else ""
-                )
-            case "vertical_panning_speed":
-                assert isinstance(value_subset, cls.VerticalPanningSpeedFields)
-                return (
-                    str(value_subset.vertical_panning_speed)
-                    if value_subset.vertical_panning_speed is not None
-                    else ""
-                )
-            case "horizontal_panning_direction":
-                assert isinstance(value_subset, cls.HorizontalPanningDirectionFields)
-                return (
-                    value_subset.horizontal_panning_direction.name
-                    if value_subset.horizontal_panning_direction is not None
-                    else ""
-                )
-            case "horizontal_panning_speed":
-                assert isinstance(value_subset, cls.HorizontalPanningSpeedFields)
-                return (
-                    str(value_subset.horizontal_panning_speed)
-                    if value_subset.horizontal_panning_speed is not None
-                    else ""
-                )
-            case "image_stabilizer_on":
-                assert isinstance(value_subset, cls.ImageStabilizerOnFields)
-                return (
-                    str(value_subset.image_stabilizer_on).upper()
-                    if value_subset.image_stabilizer_on is not None
-                    else ""
-                )
-            case "focal_length":
-                assert isinstance(value_subset, cls.FocalLengthFields)
-                return (
-                    str(value_subset.focal_length) if value_subset.focal_length is not None else ""
-                )
-            case "electric_zoom_on":
-                assert isinstance(value_subset, cls.ElectricZoomOnFields)
-                return (
-                    str(value_subset.electric_zoom_on).upper()
-                    if value_subset.electric_zoom_on is not None
-                    else ""
-                )
-            case "electric_zoom_magnification":
-                assert isinstance(value_subset, cls.ElectricZoomMagnificationFields)
-                return (
-                    str(value_subset.electric_zoom_magnification)
-                    if value_subset.electric_zoom_magnification is not None
-                    else ""
-                )
-            case _:
-                assert False
-
-    class _BinaryFields(ctypes.BigEndianStructure):
-        _pack_ = 1
-        _fields_: ClassVar = [
-            # PC 1
-            ("ones", ctypes.c_uint8, 2),
-            ("vpd", ctypes.c_uint8, 1),
-            ("v_panning_speed", ctypes.c_uint8, 5),
-            # PC 2
-            ("is_en", ctypes.c_uint8, 1),
-            ("hpd", ctypes.c_uint8, 1),
-            ("h_panning_speed", ctypes.c_uint8, 6),
-            # PC 3
-            ("focal_length", ctypes.c_uint8, 8),
-            # PC 4
-            ("zen", ctypes.c_uint8, 1),
-            ("e_zoom", ctypes.c_uint8, 7),
-        ]
+        assert text_field is not None
+        assert type(value_subset) is cls.text_fields[text_field]
+        value = getattr(value_subset, text_field)
+        return _consumer_2_text_value_formatters[text_field](value) if value is not None else ""
+
+    # Binary layout of the pack data bytes, from the most significant bit to the least:
+    #   PC 1: reserved, always 1 (2 bits), VPD (1 bit), V PANNING SPEED (5 bits)
+    #   PC 2: IS (1 bit), HPD (1 bit), H PANNING SPEED (6 bits)
+    #   PC 3: FOCAL LENGTH (8 bits)
+    #   PC 4: ZEN (1 bit), E ZOOM (7 bits)
 
     pack_type = Type.CAMERA_CONSUMER_2
 
@@ -575,50 +555,59 @@ def _do_parse_binary(
         cls, pack_bytes: bytes, system: dv_file_info.DVSystem
     ) -> CameraConsumer2 | None:
         # Unpack fields from bytes.
-        bin = cls._BinaryFields.from_buffer_copy(pack_bytes, 1)
-        if bin.e_zoom not in _electric_zoom_bits_to_magnification:
+        pc1, pc2, pc3, pc4 = pack_bytes[1], pack_bytes[2], pack_bytes[3], pack_bytes[4]
+        e_zoom = pc4 & 0x7F
+        if e_zoom not in _electric_zoom_valid_bits:
             return None
-        if bin.ones != 0x3:
+        if pc1 >> 6 != 0x3:
             return None
         return cls(
-            vertical_panning_direction=PanningDirection(bin.vpd),
-            vertical_panning_speed=bin.v_panning_speed if bin.v_panning_speed != 0x1F else None,
-            horizontal_panning_direction=PanningDirection(bin.hpd),
-            horizontal_panning_speed=(
-                bin.h_panning_speed * 2 if bin.h_panning_speed != 0x3F else None
-            ),
-            image_stabilizer_on=True if bin.is_en == 0 else False,
-            focal_length=_focal_length_bits_to_millimeters[bin.focal_length],
-            electric_zoom_on=True if bin.zen == 0 else False,
-            electric_zoom_magnification=_electric_zoom_bits_to_magnification[bin.e_zoom],
+            vertical_panning_direction=PanningDirection((pc1 >> 5) & 0x1),
+            vertical_panning_speed=_vertical_panning_speed_bits_to_speed[pc1 & 0x1F],
+            horizontal_panning_direction=PanningDirection((pc2 >> 6) & 0x1),
+            horizontal_panning_speed=_horizontal_panning_speed_bits_to_speed[pc2 & 0x3F],
+            image_stabilizer_on=True if pc2 & 0x80 == 0 else False,
+            focal_length=_focal_length_bits_to_millimeters[pc3],
+            electric_zoom_on=True if pc4 & 0x80 == 0 else False,
+            electric_zoom_magnification=_electric_zoom_bits_to_magnification[e_zoom],
         )
 
     def _do_to_binary(self, system: dv_file_info.DVSystem) -> bytes:
         assert self.vertical_panning_direction is not None
         assert self.horizontal_panning_direction is not None
-        struct = self._BinaryFields(
-            # PC 1
-            ones=0x3,
-            vpd=int(self.vertical_panning_direction),
-            v_panning_speed=(
-                self.vertical_panning_speed if self.vertical_panning_speed is not None else 0x1F
-            ),
-            # PC 2
-            is_en=0 if self.image_stabilizer_on else 1,
-            hpd=int(self.horizontal_panning_direction),
-            h_panning_speed=(
-                self.horizontal_panning_speed >> 1
-                if self.horizontal_panning_speed is not None
-                else 0x3F
-            ),
-            # PC 3
-            focal_length=_focal_length_millimeters_to_bits[self.focal_length],
-            # PC 4
-            zen=0 if self.electric_zoom_on else 1,
-            e_zoom=_electric_zoom_magnification_to_bits[
-                round(self.electric_zoom_magnification, _electric_zoom_digits)
-                if self.electric_zoom_magnification is not None
-                else None
-            ],
+        e_zoom = (
+            _electric_zoom_bits(self.electric_zoom_magnification)
+            if self.electric_zoom_magnification is not None
+            else 0x7F
+        )
+        assert e_zoom is not None  # validate() rejects unsupported magnifications
+        return bytes(
+            (
+                self.pack_type,
+                # PC 1
+                0xC0
+                | (self.vertical_panning_direction << 5)
+                | (
+                    self.vertical_panning_speed if self.vertical_panning_speed is not None else 0x1F
+                ),
+                # PC 2
+                (0 if self.image_stabilizer_on else 0x80)
+                | (self.horizontal_panning_direction << 6)
+                | (
+                    self.horizontal_panning_speed >> 1
+                    if self.horizontal_panning_speed is not None
+                    else 0x3F
+                ),
+                # PC 3
+                _focal_length_millimeters_to_bits[self.focal_length],
+                # PC 4
+                (0 if self.electric_zoom_on else 0x80) | e_zoom,
+            )
         )
-        return bytes([self.pack_type, *bytes(struct)])
+
+
+_consumer_2_empty_text_value_subsets = {
+    text_field: typ(**{text_field: None})
+    for text_field, typ in CameraConsumer2.text_fields.items()
+    if text_field is not None
+}
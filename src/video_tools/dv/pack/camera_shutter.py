@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import ctypes
+import struct
 from dataclasses import dataclass
 from typing import ClassVar
 
@@ -11,24 +11,29 @@
 
 from .base import CSVFieldMap, Pack, Type
 
+# Pack type byte, the two professional shutter speed bytes, and then PC 3 and PC 4 as one little
+# endian word: PC 3 holds the low byte of the consumer shutter speed, and PC 4 holds a reserved
+# bit followed by its high bits.
+_pack_struct = struct.Struct("<BBBH")
+
 
 # Camera shutter
 # IEC 61834-4:1998 10.16 Shutter (CAMERA)
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CameraShutter(Pack):
     shutter_speed_consumer: int | None = None
     shutter_speed_professional_upper_line: int | None = None
     shutter_speed_professional_lower_line: int | None = None
 
-    @dataclass(frozen=True, kw_only=True)
+    @dataclass(frozen=True, kw_only=True, slots=True)
     class ShutterSpeedConsumerFields:
         shutter_speed_consumer: int | None
 
-    @dataclass(frozen=True, kw_only=True)
+    @dataclass(frozen=True, kw_only=True, slots=True)
     class ShutterSpeedProfessionalUpperLineFields:
         shutter_speed_professional_upper_line: int | None
 
-    @dataclass(frozen=True, kw_only=True)
+    @dataclass(frozen=True, kw_only=True, slots=True)
     class ShutterSpeedProfessionalLowerLineFields:
         shutter_speed_professional_lower_line: int | None
 
@@ -57,64 +62,26 @@ def validate(self, system: dv_file_info.DVSystem) -> str | None:
 
         return None
 
+    # Every text field has a single integer dataclass field of the same name, so the text field
+    # conversions need no per-field dispatch at all.
+
     @classmethod
     def parse_text_value(cls, text_field: str | None, text_value: str) -> DataclassInstance:
-        match text_field:
-            case "shutter_speed_consumer":
-                return cls.ShutterSpeedConsumerFields(
-                    shutter_speed_consumer=int(text_value) if text_value else None
-                )
-            case "shutter_speed_professional_upper_line":
-                return cls.ShutterSpeedProfessionalUpperLineFields(
-                    shutter_speed_professional_upper_line=int(text_value) if text_value else None
-                )
-            case "shutter_speed_professional_lower_line":
-                return cls.ShutterSpeedProfessionalLowerLineFields(
-                    shutter_speed_professional_lower_line=int(text_value) if text_value else None
-                )
-            case _:
-                assert False
+        assert text_field is not None
+        return cls.text_fields[text_field](**{text_field: int(text_value) if text_value else None})
 
     @classmethod
     def to_text_value(cls, text_field: str | None, value_subset: DataclassInstance) -> str:
-        match text_field:
-            case "shutter_speed_consumer":
-                assert isinstance(value_subset, cls.ShutterSpeedConsumerFields)
-                return (
-                    str(value_subset.shutter_speed_consumer)
-                    if value_subset.shutter_speed_consumer is not None
-                    else ""
-                )
-            case "shutter_speed_professional_upper_line":
-                assert isinstance(value_subset, cls.ShutterSpeedProfessionalUpperLineFields)
-                return (
-                    str(value_subset.shutter_speed_professional_upper_line)
-                    if value_subset.shutter_speed_professional_upper_line is not None
-                    else ""
-                )
-            case "shutter_speed_professional_lower_line":
-                assert isinstance(value_subset, cls.ShutterSpeedProfessionalLowerLineFields)
-                return (
-                    str(value_subset.shutter_speed_professional_lower_line)
-                    if value_subset.shutter_speed_professional_lower_line is not None
-                    else ""
-                )
-            case _:
-                assert False
-
-    class _BinaryFields(ctypes.BigEndianStructure):
-        _pack_ = 1
-        _fields_: ClassVar = [
-            # PC 1
-            ("ssp1", ctypes.c_uint8, 8),
-            # PC 2
-            ("ssp2", ctypes.c_uint8, 8),
-            # PC 3
-            ("ssp_consumer_lsb", ctypes.c_uint8, 8),
-            # PC 4
-            ("one", ctypes.c_uint8, 1),
-            ("ssp_consumer_msb", ctypes.c_uint8, 7),
-        ]
+        assert text_field is not None
+        assert type(value_subset) is cls.text_fields[text_field]
+        value = getattr(value_subset, text_field)
+        return str(value) if value is not None else ""
+
+    # Binary layout of the pack data bytes, from the most significant bit to the least:
+    #   PC 1: SSP upper line (8 bits)
+    #   PC 2: SSP lower line (8 bits)
+    #   PC 3: SSP consumer LSB (8 bits)
+    #   PC 4: reserved, always 1 (1 bit), SSP consumer MSB (7 bits)
 
     pack_type = Type.CAMERA_SHUTTER
 
@@ -123,44 +90,34 @@ def _do_parse_binary(
         cls, pack_bytes: bytes, system: dv_file_info.DVSystem
     ) -> CameraShutter | None:
         # Unpack fields from bytes.
-        bin = cls._BinaryFields.from_buffer_copy(pack_bytes, 1)
+        _, ssp1, ssp2, ssp_consumer_word = _pack_struct.unpack(pack_bytes)
 
-        if bin.one != 0x1:
+        if ssp_consumer_word & 0x8000 == 0:
             return None
 
-        ssp_consumer = (bin.ssp_consumer_msb << 8) | bin.ssp_consumer_lsb
+        ssp_consumer = ssp_consumer_word & 0x7FFF
         return cls(
             shutter_speed_consumer=ssp_consumer if ssp_consumer != 0x7FFF else None,
-            shutter_speed_professional_upper_line=bin.ssp1 if bin.ssp1 != 0xFF else None,
-            shutter_speed_professional_lower_line=bin.ssp2 if bin.ssp2 != 0xFF else None,
+            shutter_speed_professional_upper_line=ssp1 if ssp1 != 0xFF else None,
+            shutter_speed_professional_lower_line=ssp2 if ssp2 != 0xFF else None,
         )
 
     def _do_to_binary(self, system: dv_file_info.DVSystem) -> bytes:
-        struct = self._BinaryFields(
+        return _pack_struct.pack(
+            self.pack_type,
             # PC 1
-            ssp1=(
+            (
                 self.shutter_speed_professional_upper_line
                 if self.shutter_speed_professional_upper_line is not None
                 else 0xFF
             ),
             # PC 2
-            ssp2=(
+            (
                 self.shutter_speed_professional_lower_line
                 if self.shutter_speed_professional_lower_line is not None
                 else 0xFF
             ),
-            # PC 3
-            ssp_consumer_lsb=(
-                self.shutter_speed_consumer & 0x00FF
-                if self.shutter_speed_consumer is not None
-                else 0xFF
-            ),
-            # PC 4
-            one=1,
-            ssp_consumer_msb=(
-                self.shutter_speed_consumer >> 8
-                if self.shutter_speed_consumer is not None
-                else 0x7F
-            ),
+            # PC 3 and PC 4
+            0x8000
+            | (self.shutter_speed_consumer if self.shutter_speed_consumer is not None else 0x7FFF),
         )
-        return bytes([self.pack_type, *bytes(struct)])
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import ctypes
 import datetime
-import re
+import functools
 from dataclasses import dataclass
 from enum import IntEnum
-from typing import ClassVar
+from typing import Any, Callable, ClassVar
 
 import video_tools.dv.data_util as du
 import video_tools.dv.file.info as dv_file_info
@@ -15,8 +14,41 @@
 
 from .base import CSVFieldMap, Pack, Type, ValidationError
 
-_generic_date_pattern = re.compile(r"^(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})$")
-_time_zone_pattern = re.compile(r"^(?P<hour>\d{2}):(?P<minute>\d{2})$")
+
+# The date and time zone text formats are fixed-width groups of digits with a separator, which is
+# simple enough to check by hand much faster than with a regular expression.
+def _split_digit_groups(
+    text_value: str, separator: str, lengths: tuple[int, ...]
+) -> list[str] | None:
+    groups = text_value.split(separator)
+    if len(groups) != len(lengths):
+        return None
+    for group, length in zip(groups, lengths):
+        if len(group) != length or not group.isdecimal():
+            return None
+    return groups
+
+
+# Every two-digit number packed as binary coded decimal: tens digit in the upper nibble and units
+# digit in the lower nibble.  The tens digit of each date field is narrow enough to sit in its
+# bits of the pack byte as-is.
+_bcd_bytes = tuple(((number // 10) << 4) | (number % 10) for number in range(100))
+# The reverse: the number held by each byte value, or None if either digit is out of range.  A
+# single lookup validates both digits at once.
+_bcd_values = tuple(
+    (byte >> 4) * 10 + (byte & 0x0F) if byte >> 4 <= 9 and byte & 0x0F <= 9 else None
+    for byte in range(0x100)
+)
+
+
+# The same recording date is repeated in every frame of a DV file, so the weekday of each date is
+# only computed once.  Returns None if the date is out of range.
+@functools.lru_cache(maxsize=4096)
+def _date_weekday(year: int, month: int, day: int) -> int | None:
+    try:
+        return datetime.date(year=year, month=month, day=day).weekday()
+    except ValueError:
+        return None
 
 
 class Week(IntEnum):
@@ -34,10 +66,16 @@ class DaylightSavingTime(IntEnum):
     NORMAL = 0x1
 
 
+# Enumeration members indexed by their raw bits, so that decoding skips the enumeration
+# constructor.  The week bits use 0x7 for no information.
+_week_bits_to_week = tuple(Week(bits) if bits != 0x7 else None for bits in range(0x8))
+_ds_to_daylight_saving_time = (DaylightSavingTime.DST, DaylightSavingTime.NORMAL)
+
+
 # Generic date base class: several pack types share the same common date fields.  This class
 # abstracts these details.
 # See the derived classes for references to the standards.
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class GenericDate(Pack):
     # The year field is a regular 4-digit field for ease of use.
     # However, the subcode only encodes a 2-digit year; we use 75 as the Y2K rollover threshold:
@@ -55,26 +93,26 @@ class GenericDate(Pack):
     # Reserved bits (normally 0x3)
     reserved: int | None = None
 
-    @dataclass(frozen=True, kw_only=True)
+    @dataclass(frozen=True, kw_only=True, slots=True)
     class MainFields:  # Formats as yyyy/mm/dd
         year: int | None
         month: int | None
         day: int | None
 
-    @dataclass(frozen=True, kw_only=True)
+    @dataclass(frozen=True, kw_only=True, slots=True)
     class WeekFields:
         week: Week | None
 
-    @dataclass(frozen=True, kw_only=True)
+    @dataclass(frozen=True, kw_only=True, slots=True)
     class TimeZoneFields:  # Formats as hh:mm
         time_zone_hours: int | None
         time_zone_30_minutes: bool | None
 
-    @dataclass(frozen=True, kw_only=True)
+    @dataclass(frozen=True, kw_only=True, slots=True)
     class DaylightSavingTimeFields:
         daylight_saving_time: DaylightSavingTime | None
 
-    @dataclass(frozen=True, kw_only=True)
+    @dataclass(frozen=True, kw_only=True, slots=True)
     class ReservedFields:
         reserved: int | None
 
@@ -99,11 +137,10 @@ def validate(self, system: dv_file_info.DVSystem) -> str | None:
         if date_present:
             # Assertion is to keep mypy happy at this point
             assert self.year is not None and self.month is not None and self.day is not None
-            try:
-                date_obj = datetime.date(year=self.year, month=self.month, day=self.day)
-            except ValueError:
+            weekday = _date_weekday(self.year, self.month, self.day)
+            if weekday is None:
                 return "The date field has an invalid range."
-            if self.week is not None and date_obj.weekday() != int(self.week):
+            if self.week is not None and weekday != self.week:
                 return "The weekday is incorrect for the given date."
             if self.year >= 2075 or self.year < 1975:
                 return "The year is too far into the future or the past."
@@ -136,101 +173,12 @@ def validate(self, system: dv_file_info.DVSystem) -> str | None:
 
     @classmethod
     def parse_text_value(cls, text_field: str | None, text_value: str) -> DataclassInstance:
-        match text_field:
-            case None:
-                match = None
-                if text_value:
-                    match = _generic_date_pattern.match(text_value)
-                    if not match:
-                        raise ValidationError(f"Parsing error while reading date {text_value}.")
-                return cls.MainFields(
-                    year=int(match.group("year")) if match else None,
-                    month=int(match.group("month")) if match else None,
-                    day=int(match.group("day")) if match else None,
-                )
-            case "week":
-                return cls.WeekFields(
-                    week=Week[text_value] if text_value else None,
-                )
-            case "tz":
-                tz_hours = None
-                tz_30_minutes = None
-                if text_value:
-                    match = _time_zone_pattern.match(text_value)
-                    if not match:
-                        raise ValidationError(
-                            f"Parsing error while reading time zone {text_value}."
-                        )
-                    if match.group("minute") != "30" and match.group("minute") != "00":
-                        raise ValidationError("Minutes portion of time zone must be 30 or 00.")
-                    tz_hours = int(match.group("hour"))
-                    tz_30_minutes = match.group("minute") == "30"
-                return cls.TimeZoneFields(
-                    time_zone_hours=tz_hours,
-                    time_zone_30_minutes=tz_30_minutes,
-                )
-            case "dst":
-                return cls.DaylightSavingTimeFields(
-                    daylight_saving_time=DaylightSavingTime[text_value] if text_value else None,
-                )
-            case "reserved":
-                return cls.ReservedFields(
-                    reserved=int(text_value, 0) if text_value else None,
-                )
-            case _:
-                assert False
+        return _date_text_value_parsers[text_field](text_value)
 
     @classmethod
     def to_text_value(cls, text_field: str | None, value_subset: DataclassInstance) -> str:
-        match text_field:
-            case None:
-                assert isinstance(value_subset, cls.MainFields)
-                mv = value_subset
-                return f"{mv.year:02}-{mv.month:02}-{mv.day:02}" if mv.year is not None else ""
-            case "week":
-                assert isinstance(value_subset, cls.WeekFields)
-                return value_subset.week.name if value_subset.week is not None else ""
-            case "tz":
-                assert isinstance(value_subset, cls.TimeZoneFields)
-                tzv = value_subset
-                return (
-                    f"{tzv.time_zone_hours:02}:{0 if not tzv.time_zone_30_minutes else 30:02}"
-                    if tzv.time_zone_hours is not None
-                    else ""
-                )
-            case "dst":
-                assert isinstance(value_subset, cls.DaylightSavingTimeFields)
-                return (
-                    value_subset.daylight_saving_time.name
-                    if value_subset.daylight_saving_time is not None
-                    else ""
-                )
-            case "reserved":
-                assert isinstance(value_subset, cls.ReservedFields)
-                return (
-                    du.hex_int(value_subset.reserved, 1)
-                    if value_subset.reserved is not None
-                    else ""
-                )
-            case _:
-                assert False
-
-    class _BinaryFields(ctypes.BigEndianStructure):
-        _pack_ = 1
-        _fields_: ClassVar = [
-            ("ds", ctypes.c_uint8, 1),
-            ("tm", ctypes.c_uint8, 1),
-            ("tz_tens", ctypes.c_uint8, 2),
-            ("tz_units", ctypes.c_uint8, 4),
-            ("reserved", ctypes.c_uint8, 2),
-            ("day_tens", ctypes.c_uint8, 2),
-            ("day_units", ctypes.c_uint8, 4),
-            ("week", ctypes.c_uint8, 3),
-            ("month_tens", ctypes.c_uint8, 1),
-            ("month_units", ctypes.c_uint8, 4),
-            ("year_tens", ctypes.c_uint8, 4),
-            ("year_units", ctypes.c_uint8, 4),
-        ]
+        assert type(value_subset) is cls.text_fields[text_field]
+        return _date_text_value_formatters[text_field](value_subset)
 
     @classmethod
     def _do_parse_binary(
@@ -243,111 +191,182 @@ def _do_parse_binary(
 
         # Unpack fields from bytes and validate them.  Validation failures are
         # common due to tape dropouts.
+        #
+        # Binary layout of the pack data bytes, from the most significant bit to the least:
+        #   PC 1: DS (1 bit), TM (1 bit), TZ tens (2 bits), TZ units (4 bits)
+        #   PC 2: reserved (2 bits), DAY tens (2 bits), DAY units (4 bits)
+        #   PC 3: WEEK (3 bits), MONTH tens (1 bit), MONTH units (4 bits)
+        #   PC 4: YEAR tens (4 bits), YEAR units (4 bits)
 
-        bin = cls._BinaryFields.from_buffer_copy(pack_bytes, 1)
+        pc1, pc2, pc3, pc4 = pack_bytes[1], pack_bytes[2], pack_bytes[3], pack_bytes[4]
 
         ds = None
         tm = None
-        tz_tens = None
-        tz_units = None
+        time_zone_hours = None
         # Time zone fields are all present or all absent
-        if bin.tz_tens != 0x3 or bin.tz_units != 0xF:
-            ds = bin.ds
-            tm = bin.tm
-            tz_tens = bin.tz_tens
-            if tz_tens > 2:
-                return None
-            tz_units = bin.tz_units
-            if tz_units > 9:
+        if pc1 & 0x3F != 0x3F:
+            ds = pc1 >> 7
+            tm = (pc1 >> 6) & 0x1
+            time_zone_hours = _bcd_values[pc1 & 0x3F]
+            # The tens digit has room for a 3, but only goes up to 2.
+            if time_zone_hours is None or time_zone_hours >= 30:
                 return None
 
-        day_tens = None
-        day_units = None
-        if bin.day_tens != 0x3 or bin.day_units != 0xF:
-            day_tens = bin.day_tens
-            day_units = bin.day_units
-            if day_units > 9:
+        day = None
+        if pc2 & 0x3F != 0x3F:
+            day = _bcd_values[pc2 & 0x3F]
+            if day is None:
                 return None
 
-        month_tens = None
-        month_units = None
-        if bin.month_tens != 0x1 or bin.month_units != 0xF:
-            month_tens = bin.month_tens
-            month_units = bin.month_units
-            if month_units > 9:
+        month = None
+        if pc3 & 0x1F != 0x1F:
+            month = _bcd_values[pc3 & 0x1F]
+            if month is None:
                 return None
 
         year = None
-        if bin.year_tens != 0xF or bin.year_units != 0xF:
-            year_tens = bin.year_tens
-            if year_tens > 9:
-                return None
-            year_units = bin.year_units
-            if year_units > 9:
+        if pc4 != 0xFF:
+            year = _bcd_values[pc4]
+            if year is None:
                 return None
-            year = year_tens * 10 + year_units
             year += 2000 if year < 75 else 1900
 
         return cls(
             year=year,
-            month=(
-                month_tens * 10 + month_units
-                if month_tens is not None and month_units is not None
-                else None
-            ),
-            day=(
-                day_tens * 10 + day_units
-                if day_tens is not None and day_units is not None
-                else None
-            ),
-            week=Week(bin.week) if bin.week != 0x7 else None,
-            time_zone_hours=(
-                tz_tens * 10 + tz_units if tz_tens is not None and tz_units is not None else None
-            ),
-            time_zone_30_minutes=(
-                (True if tm == 0 else False)
-                if tz_tens is not None and tz_units is not None
-                else None
-            ),
-            daylight_saving_time=(
-                (DaylightSavingTime.DST if ds == 0 else DaylightSavingTime.NORMAL)
-                if tz_tens is not None and tz_units is not None
-                else None
-            ),
-            reserved=bin.reserved,
+            month=month,
+            day=day,
+            week=_week_bits_to_week[pc3 >> 5],
+            time_zone_hours=time_zone_hours,
+            time_zone_30_minutes=(True if tm == 0 else False)
+            if time_zone_hours is not None
+            else None,
+            daylight_saving_time=_ds_to_daylight_saving_time[ds] if ds is not None else None,
+            reserved=pc2 >> 6,
         )
 
     def _do_to_binary(self, system: dv_file_info.DVSystem) -> bytes:
         # Good starting points to look at:
         # IEC 61834-4:1998 9.3 Rec Date (Recording date) (VAUX)
         assert self.reserved is not None  # assertion repeated from validate() to keep mypy happy
-        short_year = self.year % 100 if self.year is not None else None
-        struct = self._BinaryFields(
-            ds=0x1 if self.daylight_saving_time != DaylightSavingTime.DST else 0x0,
-            tm=0x1 if not self.time_zone_30_minutes else 0x00,
-            tz_tens=int(self.time_zone_hours / 10) if self.time_zone_hours is not None else 0x3,
-            tz_units=self.time_zone_hours % 10 if self.time_zone_hours is not None else 0xF,
-            reserved=self.reserved,
-            day_tens=int(self.day / 10) if self.day is not None else 0x3,
-            day_units=self.day % 10 if self.day is not None else 0xF,
-            week=int(self.week) if self.week is not None else 0x7,
-            month_tens=int(self.month / 10) if self.month is not None else 0x1,
-            month_units=self.month % 10 if self.month is not None else 0xF,
-            year_tens=int(short_year / 10) if short_year is not None else 0xF,
-            year_units=short_year % 10 if short_year is not None else 0xF,
+        # validate() guarantees that the date and time zone are each fully present or absent.
+        if self.year is None and self.time_zone_hours is None:
+            return _absent_date_bytes[self.pack_type, self.reserved]
+        return bytes(
+            (
+                self.pack_type,
+                # PC 1
+                (0x80 if self.daylight_saving_time != DaylightSavingTime.DST else 0x00)
+                | (0x40 if not self.time_zone_30_minutes else 0x00)
+                | (_bcd_bytes[self.time_zone_hours] if self.time_zone_hours is not None else 0x3F),
+                # PC 2
+                (self.reserved << 6) | (_bcd_bytes[self.day] if self.day is not None else 0x3F),
+                # PC 3
+                ((self.week if self.week is not None else 0x7) << 5)
+                | (_bcd_bytes[self.month] if self.month is not None else 0x1F),
+                # PC 4
+                _bcd_bytes[self.year % 100] if self.year is not None else 0xFF,
+            )
         )
-        return bytes([self.pack_type, *bytes(struct)])
+
+
+# Packs with neither a date nor a time zone are common, and only differ in the pack type and
+# reserved bits, so their binary forms are precomputed.
+_absent_date_bytes = {
+    (pack_type, reserved): bytes((pack_type, 0xFF, (reserved << 6) | 0x3F, 0xFF, 0xFF))
+    for pack_type in (Type.AAUX_RECORDING_DATE, Type.VAUX_RECORDING_DATE)
+    for reserved in range(0x4)
+}
+
+
+# Text field dispatch tables used by GenericDate.parse_text_value and to_text_value.  Looking the
+# conversion up in a dict avoids walking through a match statement for every field of every pack.
+def _parse_main_text_value(text_value: str) -> GenericDate.MainFields:
+    if not text_value:
+        return GenericDate.MainFields(year=None, month=None, day=None)
+    date_groups = _split_digit_groups(text_value, "-", (4, 2, 2))
+    if date_groups is None:
+        raise ValidationError(f"Parsing error while reading date {text_value}.")
+    year, month, day = date_groups
+    return GenericDate.MainFields(year=int(year), month=int(month), day=int(day))
+
+
+def _parse_time_zone_text_value(text_value: str) -> GenericDate.TimeZoneFields:
+    if not text_value:
+        return GenericDate.TimeZoneFields(time_zone_hours=None, time_zone_30_minutes=None)
+    tz_groups = _split_digit_groups(text_value, ":", (2, 2))
+    if tz_groups is None:
+        raise ValidationError(f"Parsing error while reading time zone {text_value}.")
+    hour, minute = tz_groups
+    if minute != "30" and minute != "00":
+        raise ValidationError("Minutes portion of time zone must be 30 or 00.")
+    return GenericDate.TimeZoneFields(
+        time_zone_hours=int(hour), time_zone_30_minutes=minute == "30"
+    )
+
+
+# Precomputed zero-padded text for two-digit numbers.  Out of range numbers from an invalid pack
+# still fall back to formatting the value on the fly.
+_two_digit_text: dict[int | None, str] = {number: f"{number:02}" for number in range(100)}
+_year_text = {year: str(year) for year in range(1975, 2075)}
+
+
+def _format_main_text_value(mv: GenericDate.MainFields) -> str:
+    if mv.year is None:
+        return ""
+    return (
+        (_year_text.get(mv.year) or f"{mv.year:02}")
+        + "-"
+        + (_two_digit_text.get(mv.month) or f"{mv.month:02}")
+        + "-"
+        + (_two_digit_text.get(mv.day) or f"{mv.day:02}")
+    )
+
+
+def _format_time_zone_text_value(tzv: GenericDate.TimeZoneFields) -> str:
+    if tzv.time_zone_hours is None:
+        return ""
+    return (_two_digit_text.get(tzv.time_zone_hours) or f"{tzv.time_zone_hours:02}") + (
+        ":30" if tzv.time_zone_30_minutes else ":00"
+    )
+
+
+_date_text_value_parsers: dict[str | None, Callable[[str], DataclassInstance]] = {
+    None: _parse_main_text_value,
+    "week": lambda text_value: GenericDate.WeekFields(
+        week=Week[text_value] if text_value else None
+    ),
+    "tz": _parse_time_zone_text_value,
+    "dst": lambda text_value: GenericDate.DaylightSavingTimeFields(
+        daylight_saving_time=DaylightSavingTime[text_value] if text_value else None
+    ),
+    "reserved": lambda text_value: GenericDate.ReservedFields(
+        reserved=int(text_value, 0) if text_value else None
+    ),
+}
+_date_text_value_formatters: dict[str | None, Callable[[Any], str]] = {
+    None: _format_main_text_value,
+    "week": lambda value_subset: value_subset.week.name if value_subset.week is not None else "",
+    "tz": _format_time_zone_text_value,
+    "dst": lambda value_subset: (
+        value_subset.daylight_saving_time.name
+        if value_subset.daylight_saving_time is not None
+        else ""
+    ),
+    "reserved": lambda value_subset: (
+        du.hex_int(value_subset.reserved, 1) if value_subset.reserved is not None else ""
+    ),
+}
 
 
 # AAUX recording date
 # IEC 61834-4:1998 8.3 Rec Date (AAUX)
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AAUXRecordingDate(GenericDate):
     pack_type = Type.AAUX_RECORDING_DATE
 
 
 # VAUX recording date
 # IEC 61834-4:1998 9.3 Rec Date (Recording date) (VAUX)
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class VAUXRecordingDate(GenericDate):
     pack_type = Type.VAUX_RECORDING_DATE
@@ -5,16 +5,21 @@
 from dataclasses import dataclass
 from typing import ClassVar
 
-import video_tools.dv.data_util as du
 import video_tools.dv.file.info as dv_file_info
 from video_tools.typing import DataclassInstance
 
 from .base import CSVFieldMap, Pack, Type, ValidationError
 
+# Single byte headers for each binary group pack type, so that encoding is one concatenation.
+_pack_type_bytes = {
+    pack_type: bytes((pack_type,))
+    for pack_type in (Type.TITLE_BINARY_GROUP, Type.AAUX_BINARY_GROUP, Type.VAUX_BINARY_GROUP)
+}
+
 
 # Generic SMPTE binary group base class: several pack types reuse the same structure.
 # See the derived classes for references to the standards.
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class GenericBinaryGroup(Pack):
     # this will always be 4 bytes
     value: bytes | None = None
@@ -46,46 +51,41 @@ def parse_text_value(cls, text_field: str | None, text_value: str) -> DataclassI
     def to_text_value(cls, text_field: str | None, value_subset: DataclassInstance) -> str:
         assert text_field is None
         assert isinstance(value_subset, cls.MainFields)
-        return du.hex_bytes(value_subset.value) if value_subset.value is not None else ""
+        # Same text as data_util.hex_bytes, but bytes.hex() formats every byte in a single call.
+        return "0x" + value_subset.value.hex().upper() if value_subset.value is not None else ""
 
     @classmethod
     def _do_parse_binary(
         cls, pack_bytes: bytes, system: dv_file_info.DVSystem
     ) -> GenericBinaryGroup | None:
-        return cls(value=bytes(pack_bytes[1:]))
+        # Pack.parse_binary always passes an immutable bytes object, so slicing it already yields
+        # the immutable 4 byte value without another copy through bytes().
+        return cls(value=pack_bytes[1:])
 
     def _do_to_binary(self, system: dv_file_info.DVSystem) -> bytes:
         assert self.value is not None  # assertion repeated from validate() to keep mypy happy
-        return bytes(
-            [
-                self.pack_type,
-                self.value[0],
-                self.value[1],
-                self.value[2],
-                self.value[3],
-            ]
-        )
+        return _pack_type_bytes[self.pack_type] + self.value
 
 
 # Title binary group
 # SMPTE 306M-2002 Section 9.2.2 Binary group pack (BG)
 # IEC 61834-4:1998 4.5 Binary Group (TITLE)
 # Also see SMPTE 12M
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TitleBinaryGroup(GenericBinaryGroup):
     pack_type = Type.TITLE_BINARY_GROUP
 
 
 # AAUX binary group
 # IEC 61834-4:1998 8.5 Binary Group (AAUX)
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AAUXBinaryGroup(GenericBinaryGroup):
     pack_type = Type.AAUX_BINARY_GROUP
 
 
 # VAUX binary group
 # IEC 61834-4:1998 9.5 Binary Group (VAUX)
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class VAUXBinaryGroup(GenericBinaryGroup):
     pack_type = Type.VAUX_BINARY_GROUP
 
@@ -93,7 +93,7 @@ class VAUXBinaryGroup(GenericBinaryGroup):
 # No Info block
 # IEC 61834-4:1998 12.16 No Info: No information (SOFT MODE)
 # Also, very commonly a dropout - especially in the subcode DIF block
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class NoInfo(Pack):
     text_fields: ClassVar[CSVFieldMap] = {}
 
@@ -118,16 +118,22 @@ def _do_parse_binary(cls, pack_bytes: bytes, system: dv_file_info.DVSystem) -> N
         # see other non-0xFF bytes here.  Unfortunately, in such a scenario, since the pack header
         # was lost, we don't know what pack that data is supposed to go with.  So we'll just let
         # this pack discard those bytes as it's probably not worth trying to preserve them.
-        return cls()
+        #
+        # The pack has no fields, so every parse can share one immutable instance.
+        return _no_info_pack
 
     def _do_to_binary(self, system: dv_file_info.DVSystem) -> bytes:
-        return bytes([self.pack_type, 0xFF, 0xFF, 0xFF, 0xFF])
+        return _no_info_bytes
+
+
+_no_info_pack = NoInfo()
+_no_info_bytes = bytes([Type.NO_INFO, 0xFF, 0xFF, 0xFF, 0xFF])
 
 
 # Unknown pack: holds the bytes for any pack type we don't know about in a particular DIF block.
 # These are not aggregated or written to the CSV, since it isn't known if it's meaningful to do
 # that.  They do show up when parsing DIF blocks so that we can retain the bytes.
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Unknown(Pack):
     # this will always be 5 bytes: includes the pack header
     value: bytes | None = None
@@ -154,6 +160,7 @@ def to_text_value(cls, text_field: str | None, value_subset: DataclassInstance)
 
     @classmethod
     def _do_parse_binary(cls, pack_bytes: bytes, system: dv_file_info.DVSystem) -> Unknown | None:
+        # bytes() hands back a bytes object as-is, and only copies other buffer types.
         return cls(value=bytes(pack_bytes))
 
     @classmethod
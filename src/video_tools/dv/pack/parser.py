@@ -1,10 +1,14 @@
+from typing import Callable
+
+import numpy as np
+import numpy.typing as npt
+
 import video_tools.dv.file.info as dv_file_info
 
 from .aaux_source import AAUXSource
 from .aaux_source_control import AAUXSourceControl
 from .base import (
     Pack,
-    Type,
 )
 from .camera_consumer import (
     CameraConsumer1,
@@ -30,6 +34,34 @@
 from .vaux_source import VAUXSource
 from .vaux_source_control import VAUXSourceControl
 
+# Parser to use for each known pack header byte.  Any other header is an unknown pack.
+_known_pack_parsers: dict[int, Callable[[bytes, dv_file_info.DVSystem], Pack | None]] = {
+    cls.pack_type: cls.parse_binary
+    for cls in (
+        TitleTimecode,
+        TitleBinaryGroup,
+        AAUXSource,
+        AAUXSourceControl,
+        AAUXRecordingDate,
+        AAUXRecordingTime,
+        AAUXBinaryGroup,
+        VAUXSource,
+        VAUXSourceControl,
+        VAUXRecordingDate,
+        VAUXRecordingTime,
+        VAUXBinaryGroup,
+        CameraConsumer1,
+        CameraConsumer2,
+        CameraShutter,
+        NoInfo,
+    )
+}
+# Indexing a table by the header byte is quicker than walking through a match statement for every
+# pack in a DV file.
+_pack_parsers = tuple(
+    _known_pack_parsers.get(pack_type, Unknown.parse_binary) for pack_type in range(0x100)
+)
+
 
 def parse_binary(pack_bytes: bytes, system: dv_file_info.DVSystem) -> Pack | None:
     """Create a new instance of a block by parsing a binary DIF block from a DV file.
@@ -38,38 +70,20 @@ def parse_binary(pack_bytes: bytes, system: dv_file_info.DVSystem) -> Pack | Non
     one of the derived classes, based on the detected block type.
     """
     assert len(pack_bytes) == 5
-    match pack_bytes[0]:
-        case Type.TITLE_TIMECODE:
-            return TitleTimecode.parse_binary(pack_bytes, system)
-        case Type.TITLE_BINARY_GROUP:
-            return TitleBinaryGroup.parse_binary(pack_bytes, system)
-        case Type.AAUX_SOURCE:
-            return AAUXSource.parse_binary(pack_bytes, system)
-        case Type.AAUX_SOURCE_CONTROL:
-            return AAUXSourceControl.parse_binary(pack_bytes, system)
-        case Type.AAUX_RECORDING_DATE:
-            return AAUXRecordingDate.parse_binary(pack_bytes, system)
-        case Type.AAUX_RECORDING_TIME:
-            return AAUXRecordingTime.parse_binary(pack_bytes, system)
-        case Type.AAUX_BINARY_GROUP:
-            return AAUXBinaryGroup.parse_binary(pack_bytes, system)
-        case Type.VAUX_SOURCE:
-            return VAUXSource.parse_binary(pack_bytes, system)
-        case Type.VAUX_SOURCE_CONTROL:
-            return VAUXSourceControl.parse_binary(pack_bytes, system)
-        case Type.VAUX_RECORDING_DATE:
-            return VAUXRecordingDate.parse_binary(pack_bytes, system)
-        case Type.VAUX_RECORDING_TIME:
-            return VAUXRecordingTime.parse_binary(pack_bytes, system)
-        case Type.VAUX_BINARY_GROUP:
-            return VAUXBinaryGroup.parse_binary(pack_bytes, system)
-        case Type.CAMERA_CONSUMER_1:
-            return CameraConsumer1.parse_binary(pack_bytes, system)
-        case Type.CAMERA_CONSUMER_2:
-            return CameraConsumer2.parse_binary(pack_bytes, system)
-        case Type.CAMERA_SHUTTER:
-            return CameraShutter.parse_binary(pack_bytes, system)
-        case Type.NO_INFO:
-            return NoInfo.parse_binary(pack_bytes, system)
-        case _:
-            return Unknown.parse_binary(pack_bytes, system)
+    return _pack_parsers[pack_bytes[0]](pack_bytes, system)
+
+
+def parse_binary_batch(
+    packs: npt.NDArray[np.uint8], system: dv_file_info.DVSystem
+) -> list[Pack | None]:
+    """Parse many binary packs of any type at once.
+
+    The input array is expected to have a shape of (N, 5), with one pack per row.  Each distinct
+    row is dispatched and parsed only once, and the resulting instances are shared.
+    """
+    assert packs.ndim == 2 and packs.shape[1] == 5
+    if len(packs) == 0:
+        return []
+    unique_packs, inverse = np.unique(packs, axis=0, return_inverse=True)
+    parsed = [_pack_parsers[row[0]](row.tobytes(), system) for row in unique_packs]
+    return [parsed[i] for i in inverse.ravel().tolist()]
@@ -26,3 +26,49 @@ class SourceSituation(IntEnum):
     SCRAMBLED_SOURCE_WITH_AUDIENCE_RESTRICTIONS = 0x0
     SCRAMBLED_SOURCE_WITHOUT_AUDIENCE_RESTRICTIONS = 0x1
     SOURCE_WITH_AUDIENCE_RESTRICTIONS = 0x2
+
+
+# Tables for decoding the bits shared by the AAUX and VAUX source control packs.  Indexing a tuple
+# by the raw bits is much faster than calling the IntEnum constructor for every parsed pack.  The
+# all-ones value means "no information" for the fields that allow it.
+_cgms_to_copy_protection = tuple(CopyProtection(bits) for bits in range(0x4))
+_isr_to_input_source = tuple(InputSource(bits) if bits != 0x3 else None for bits in range(0x4))
+_cmp_to_compression_count = tuple(
+    CompressionCount(bits) if bits != 0x3 else None for bits in range(0x4)
+)
+_ss_to_source_situation = tuple(
+    SourceSituation(bits) if bits != 0x3 else None for bits in range(0x4)
+)
+
+# The first data byte of both source control packs has the same layout, from the most
+# significant bit to the least:
+#   PC 1: CGMS (2 bits), ISR (2 bits), CMP (2 bits), SS (2 bits)
+# Every possible byte value is decoded up front, so that both packs can unpack the byte with a
+# single lookup.
+_SourceControlPC1Fields = tuple[
+    CopyProtection, InputSource | None, CompressionCount | None, SourceSituation | None
+]
+_pc1_to_source_control_fields: tuple[_SourceControlPC1Fields, ...] = tuple(
+    (
+        _cgms_to_copy_protection[pc1 >> 6],
+        _isr_to_input_source[(pc1 >> 4) & 0x03],
+        _cmp_to_compression_count[(pc1 >> 2) & 0x03],
+        _ss_to_source_situation[pc1 & 0x03],
+    )
+    for pc1 in range(0x100)
+)
+
+
+def _source_control_pc1(
+    copy_protection: CopyProtection,
+    input_source: InputSource | None,
+    compression_count: CompressionCount | None,
+    source_situation: SourceSituation | None,
+) -> int:
+    """Pack the shared source control fields into the first data byte of the pack."""
+    return (
+        (copy_protection << 6)
+        | ((input_source if input_source is not None else 0x3) << 4)
+        | ((compression_count if compression_count is not None else 0x3) << 2)
+        | (source_situation if source_situation is not None else 0x3)
+    )
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import ctypes
-import datetime
+import functools
 import re
-from dataclasses import dataclass, replace
+from dataclasses import dataclass, fields
 from enum import IntEnum
-from typing import Any, ClassVar, cast
+from typing import Any, Callable, ClassVar, cast
 
 import video_tools.dv.data_util as du
 import video_tools.dv.file.info as dv_file_info
@@ -38,16 +37,43 @@ class BlankFlag(IntEnum):
     CONTINUOUS = 0x1
 
 
+# Enum members for each value of the single-bit pack fields, indexed by the bit.
+_cf_to_color_frame = (ColorFrame.UNSYNCHRONIZED, ColorFrame.SYNCHRONIZED)
+_pc_to_polarity_correction = (PolarityCorrection.EVEN, PolarityCorrection.ODD)
+_bf_to_blank_flag = (BlankFlag.DISCONTINUOUS, BlankFlag.CONTINUOUS)
+
+# Whole number of timecode frames per second for each system.
+_frames_per_second = {
+    dv_file_info.DVSystem.SYS_525_60: 30,
+    dv_file_info.DVSystem.SYS_625_50: 25,
+}
+
+# Every two-digit number packed as binary coded decimal: tens digit in the upper nibble and units
+# digit in the lower nibble.  The tens digit of each timecode field is narrow enough to sit in its
+# bits of the pack byte as-is.
+_bcd_bytes = tuple(((number // 10) << 4) | (number % 10) for number in range(100))
+
+# Matched with fullmatch(), so the pattern needs no anchors.
 _smpte_time_pattern = re.compile(
-    r"^(?P<hour>\d{2}):(?P<minute>\d{2}):(?P<second>\d{2})"
-    r"((?P<frame_separator>[:;])(?P<frame>\d{2}))?$"
+    r"(?P<hour>\d{2}):(?P<minute>\d{2}):(?P<second>\d{2})"
+    r"(?:(?P<frame_separator>[:;])(?P<frame>\d{2}))?"
 )
 
 
+@functools.cache
+def _non_time_field_names(cls: type[GenericTimecode]) -> tuple[str, ...]:
+    """Names of the initializer fields of a timecode pack class, other than the time itself."""
+    return tuple(
+        field.name
+        for field in fields(cls)
+        if field.init and field.name not in ("hour", "minute", "second", "frame")
+    )
+
+
 # Generic timecode base class: several pack types share mostly the same common timecode fields,
 # with only a very few minor variations.  This class abstracts these details.
 # See the derived classes for references to the standards.
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class GenericTimecode(Pack):
     hour: int | None = None
     minute: int | None = None
@@ -122,11 +148,10 @@ def validate(self, system: dv_file_info.DVSystem) -> str | None:
 
         # Check ranges of values
         if time_present:
-            try:
-                # Assertion is to keep mypy happy at this point
-                assert self.hour is not None and self.minute is not None and self.second is not None
-                datetime.time(hour=self.hour, minute=self.minute, second=self.second)
-            except ValueError:
+            # Assertion is to keep mypy happy at this point
+            assert self.hour is not None and self.minute is not None and self.second is not None
+            # Same ranges that datetime.time accepts, without constructing one.
+            if not (0 <= self.hour < 24 and 0 <= self.minute < 60 and 0 <= self.second < 60):
                 return "The time field has an invalid range."
 
         if self.frame is not None:
@@ -153,97 +178,19 @@ def validate(self, system: dv_file_info.DVSystem) -> str | None:
 
     @classmethod
     def parse_text_value(cls, text_field: str | None, text_value: str) -> DataclassInstance:
-        match text_field:
-            case None:
-                match = None
-                if text_value:
-                    match = _smpte_time_pattern.match(text_value)
-                    if not match:
-                        raise ValidationError(f"Parsing error while reading timecode {text_value}.")
-                return cls.MainFields(
-                    hour=int(match.group("hour")) if match else None,
-                    minute=int(match.group("minute")) if match else None,
-                    second=int(match.group("second")) if match else None,
-                    # frames are optional in this regex
-                    frame=int(match.group("frame")) if match and match.group("frame") else None,
-                    drop_frame=(
-                        match.group("frame_separator") == ";"
-                        if match and match.group("frame_separator")
-                        # If the frames are missing, we'll just set the DF bit since that's how I've
-                        # observed it happening in practice on a VAUX Rec Date pack from my camera.
-                        # This is also the value we'd want to set if the time is missing completely.
-                        else True
-                    ),
-                )
-            case "color_frame":
-                return cls.ColorFrameFields(
-                    color_frame=ColorFrame[text_value] if text_value else None,
-                )
-            case "polarity_correction":
-                return cls.PolarityCorrectionFields(
-                    polarity_correction=PolarityCorrection[text_value] if text_value else None,
-                )
-            case "binary_group_flags":
-                return cls.BinaryGroupFlagsFields(
-                    binary_group_flags=int(text_value, 0) if text_value else None,
-                )
-            case _:
-                assert False
+        return _timecode_text_value_parsers[text_field](text_value)
 
     @classmethod
     def to_text_value(cls, text_field: str | None, value_subset: DataclassInstance) -> str:
-        match text_field:
-            case None:
-                assert isinstance(value_subset, cls.MainFields)
-                v = value_subset
-                if v.hour is None:
-                    return ""
-                if v.frame is None:
-                    return f"{v.hour:02}:{v.minute:02}:{v.second:02}"
-                return (
-                    f"{v.hour:02}:{v.minute:02}:{v.second:02};{v.frame:02}"
-                    if v.drop_frame
-                    else f"{v.hour:02}:{v.minute:02}:{v.second:02}:{v.frame:02}"
-                )
-
-            case "color_frame":
-                assert isinstance(value_subset, cls.ColorFrameFields)
-                return value_subset.color_frame.name if value_subset.color_frame is not None else ""
-            case "polarity_correction":
-                assert isinstance(value_subset, cls.PolarityCorrectionFields)
-                return (
-                    value_subset.polarity_correction.name
-                    if value_subset.polarity_correction is not None
-                    else ""
-                )
-            case "binary_group_flags":
-                assert isinstance(value_subset, cls.BinaryGroupFlagsFields)
-                return (
-                    du.hex_int(value_subset.binary_group_flags, 1)
-                    if value_subset.binary_group_flags is not None
-                    else ""
-                )
-            case _:
-                assert False
-
-    class _BinaryFields(ctypes.BigEndianStructure):
-        _pack_ = 1
-        _fields_: ClassVar = [
-            ("cf", ctypes.c_uint8, 1),
-            ("df", ctypes.c_uint8, 1),
-            ("frame_tens", ctypes.c_uint8, 2),
-            ("frame_units", ctypes.c_uint8, 4),
-            ("pc2_8", ctypes.c_uint8, 1),
-            ("second_tens", ctypes.c_uint8, 3),
-            ("second_units", ctypes.c_uint8, 4),
-            ("pc3_8", ctypes.c_uint8, 1),
-            ("minute_tens", ctypes.c_uint8, 3),
-            ("minute_units", ctypes.c_uint8, 4),
-            ("pc4_8", ctypes.c_uint8, 1),
-            ("bgf1", ctypes.c_uint8, 1),
-            ("hour_tens", ctypes.c_uint8, 2),
-            ("hour_units", ctypes.c_uint8, 4),
-        ]
+        assert type(value_subset) is cls.text_fields[text_field]
+        return _timecode_text_value_formatters[text_field](value_subset)
+
+    # Binary layout of the pack data bytes, from the most significant bit to the least:
+    #   PC 1: CF (1 bit), DF (1 bit), FRAME tens (2 bits), FRAME units (4 bits)
+    #   PC 2: PC/BGF0 (1 bit), SECOND tens (3 bits), SECOND units (4 bits)
+    #   PC 3: BGF0/BGF2 (1 bit), MINUTE tens (3 bits), MINUTE units (4 bits)
+    #   PC 4: BGF2/PC (1 bit), BGF1 (1 bit), HOUR tens (2 bits), HOUR units (4 bits)
+    # The meaning of the most significant bit of PC 2 through PC 4 depends on the system.
 
     @classmethod
     def _do_parse_binary_generic_tc(
@@ -258,57 +205,59 @@ def _do_parse_binary_generic_tc(
         # Unpack fields from bytes and validate them.  Validation failures are
         # common due to tape dropouts.
 
-        bin = cls._BinaryFields.from_buffer_copy(pack_bytes, 1)
+        pc1, pc2, pc3, pc4 = pack_bytes[1], pack_bytes[2], pack_bytes[3], pack_bytes[4]
+        # The meaning of the most significant bits only depends on the system, so check it once.
+        is_525 = system is dv_file_info.DVSystem.SYS_525_60
 
         frame_tens = None
         frame_units = None
-        if bin.frame_tens != 0x3 or bin.frame_units != 0xF:
-            frame_tens = bin.frame_tens
+        if pc1 & 0x3F != 0x3F:
+            frame_tens = (pc1 >> 4) & 0x3
             if frame_tens > 2:
                 return None
-            frame_units = bin.frame_units
+            frame_units = pc1 & 0x0F
             if frame_units > 9:
                 return None
 
-        if system == dv_file_info.DVSystem.SYS_525_60:
-            pc = bin.pc2_8
-        elif system == dv_file_info.DVSystem.SYS_625_50:
-            bgf0 = bin.pc2_8
+        if is_525:
+            pc = pc2 >> 7
+        else:
+            bgf0 = pc2 >> 7
         second_tens = None
         second_units = None
-        if bin.second_tens != 0x7 or bin.second_units != 0xF:
-            second_tens = bin.second_tens
+        if pc2 & 0x7F != 0x7F:
+            second_tens = (pc2 >> 4) & 0x7
             if second_tens > 5:
                 return None
-            second_units = bin.second_units
+            second_units = pc2 & 0x0F
             if second_units > 9:
                 return None
 
-        if system == dv_file_info.DVSystem.SYS_525_60:
-            bgf0 = bin.pc3_8
-        elif system == dv_file_info.DVSystem.SYS_625_50:
-            bgf2 = bin.pc3_8
+        if is_525:
+            bgf0 = pc3 >> 7
+        else:
+            bgf2 = pc3 >> 7
         minute_tens = None
         minute_units = None
-        if bin.minute_tens != 0x7 or bin.minute_units != 0xF:
-            minute_tens = bin.minute_tens
+        if pc3 & 0x7F != 0x7F:
+            minute_tens = (pc3 >> 4) & 0x7
             if minute_tens > 5:
                 return None
-            minute_units = bin.minute_units
+            minute_units = pc3 & 0x0F
             if minute_units > 9:
                 return None
 
-        if system == dv_file_info.DVSystem.SYS_525_60:
-            bgf2 = bin.pc4_8
-        elif system == dv_file_info.DVSystem.SYS_625_50:
-            pc = bin.pc4_8
+        if is_525:
+            bgf2 = pc4 >> 7
+        else:
+            pc = pc4 >> 7
         hour_tens = None
         hour_units = None
-        if bin.hour_tens != 0x3 or bin.hour_units != 0xF:
-            hour_tens = bin.hour_tens
+        if pc4 & 0x3F != 0x3F:
+            hour_tens = (pc4 >> 4) & 0x3
             if hour_tens > 2:
                 return None
-            hour_units = bin.hour_units
+            hour_units = pc4 & 0x0F
             if hour_units > 9:
                 return None
 
@@ -333,10 +282,10 @@ def _do_parse_binary_generic_tc(
                 if frame_tens is not None and frame_units is not None
                 else None
             ),
-            drop_frame=bin.df == 1,
-            color_frame=(ColorFrame.SYNCHRONIZED if bin.cf == 1 else ColorFrame.UNSYNCHRONIZED),
-            polarity_correction=(PolarityCorrection.ODD if pc == 1 else PolarityCorrection.EVEN),
-            binary_group_flags=(bgf2 << 2) | (bin.bgf1 << 1) | bgf0,
+            drop_frame=pc1 & 0x40 != 0,
+            color_frame=_cf_to_color_frame[pc1 >> 7],
+            polarity_correction=_pc_to_polarity_correction[pc],
+            binary_group_flags=(bgf2 << 2) | ((pc4 >> 5) & 0x2) | bgf0,
             **init_kwargs,
         )
 
@@ -362,23 +311,26 @@ def _do_to_binary(self, system: dv_file_info.DVSystem) -> bytes:
         bgf0 = self.binary_group_flags & 0x01
         bgf1 = (self.binary_group_flags & 0x02) >> 1
         bgf2 = (self.binary_group_flags & 0x04) >> 2
-        struct = self._BinaryFields(
-            cf=self.color_frame,
-            df=self.drop_frame,
-            frame_tens=int(self.frame / 10) if self.frame is not None else 0x3,
-            frame_units=self.frame % 10 if self.frame is not None else 0xF,
-            pc2_8=pc if system == dv_file_info.DVSystem.SYS_525_60 else bgf0,
-            second_tens=int(self.second / 10) if self.second is not None else 0x7,
-            second_units=self.second % 10 if self.second is not None else 0xF,
-            pc3_8=bgf0 if system == dv_file_info.DVSystem.SYS_525_60 else bgf2,
-            minute_tens=int(self.minute / 10) if self.minute is not None else 0x7,
-            minute_units=self.minute % 10 if self.minute is not None else 0xF,
-            pc4_8=bgf2 if system == dv_file_info.DVSystem.SYS_525_60 else pc,
-            bgf1=bgf1,
-            hour_tens=int(self.hour / 10) if self.hour is not None else 0x3,
-            hour_units=self.hour % 10 if self.hour is not None else 0xF,
+        is_525 = system is dv_file_info.DVSystem.SYS_525_60
+        return bytes(
+            (
+                self.pack_type,
+                # PC 1
+                (self.color_frame << 7)
+                | (0x40 if self.drop_frame else 0x00)
+                | (_bcd_bytes[self.frame] if self.frame is not None else 0x3F),
+                # PC 2
+                ((pc if is_525 else bgf0) << 7)
+                | (_bcd_bytes[self.second] if self.second is not None else 0x7F),
+                # PC 3
+                ((bgf0 if is_525 else bgf2) << 7)
+                | (_bcd_bytes[self.minute] if self.minute is not None else 0x7F),
+                # PC 4
+                ((bgf2 if is_525 else pc) << 7)
+                | (bgf1 << 6)
+                | (_bcd_bytes[self.hour] if self.hour is not None else 0x3F),
+            )
         )
-        return bytes([self.pack_type, *bytes(struct)])
 
     def increment_frame(self, system: dv_file_info.DVSystem) -> GenericTimecode:
         """Return a copy with frame incremented by 1."""
@@ -397,38 +349,44 @@ def increment_frame(self, system: dv_file_info.DVSystem) -> GenericTimecode:
                 "Drop frame flag is set on PAL/SECAM video, which probably doesn't make sense."
             )
 
-        # Increment values as appropriate
+        # Increment values as appropriate.  Each unit can only roll over if the one below it
+        # just did, so the checks are nested: the common case is a single comparison.
         f += 1
-        if system == dv_file_info.DVSystem.SYS_525_60 and f == 30:
-            s += 1
+        if f == _frames_per_second[system]:
             f = 0
-        elif system == dv_file_info.DVSystem.SYS_625_50 and f == 25:
             s += 1
-            f = 0
-        if s == 60:
-            m += 1
-            s = 0
-        if m == 60:
-            h += 1
-            m = 0
-        if h == 24:
-            h = 0
-            m = 0
-            s = 0
-            f = 0
+            if s == 60:
+                s = 0
+                m += 1
+                if m == 60:
+                    m = 0
+                    h += 1
+                    if h == 24:
+                        h = 0
 
         # Process drop frames
         if self.drop_frame and f <= 1 and s == 0 and m % 10 > 0:
             f = 2
 
-        return replace(self, hour=h, minute=m, second=s, frame=f)
+        return self._with_time(h, m, s, f)
+
+    def _with_time(self, hour: int, minute: int, second: int, frame: int) -> GenericTimecode:
+        # Return a copy with the given time.  Passing the other fields straight to the constructor
+        # is much faster than dataclasses.replace(), which inspects every field.
+        return type(self)(
+            hour=hour,
+            minute=minute,
+            second=second,
+            frame=frame,
+            **{name: getattr(self, name) for name in _non_time_field_names(type(self))},
+        )
 
 
 # Title timecode
 # SMPTE 306M-2002 Section 9.2.1 Time code pack (TC)
 # IEC 61834-4:1998 4.4 Time Code (TITLE)
 # Also see SMPTE 12M
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TitleTimecode(GenericTimecode):
     # IEC 61834-4:1998 defines this field instead of the other SMPTE fields
     # when not recording TITLE BINARY pack.  In that scenario, the remaining
@@ -449,7 +407,7 @@ class BlankFlagFields:
     }
 
     def validate(self, system: dv_file_info.DVSystem) -> str | None:
-        base_validate = super().validate(system)
+        base_validate = super(TitleTimecode, self).validate(system)
         if base_validate is not None:
             return base_validate
 
@@ -468,18 +426,12 @@ def validate(self, system: dv_file_info.DVSystem) -> str | None:
 
     @classmethod
     def parse_text_value(cls, text_field: str | None, text_value: str) -> DataclassInstance:
-        if text_field == "blank_flag":
-            return cls.BlankFlagFields(
-                blank_flag=BlankFlag[text_value] if text_value else None,
-            )
-        return super().parse_text_value(text_field, text_value)
+        return _title_timecode_text_value_parsers[text_field](text_value)
 
     @classmethod
     def to_text_value(cls, text_field: str | None, value_subset: DataclassInstance) -> str:
-        if text_field == "blank_flag":
-            assert isinstance(value_subset, cls.BlankFlagFields)
-            return value_subset.blank_flag.name if value_subset.blank_flag is not None else ""
-        return super().to_text_value(text_field, value_subset)
+        assert type(value_subset) is cls.text_fields[text_field]
+        return _title_timecode_text_value_formatters[text_field](value_subset)
 
     pack_type = Type.TITLE_TIMECODE
 
@@ -493,21 +445,114 @@ def _do_parse_binary(
 
         # NOTE: CF bit is also BF bit in IEC 61834-4 if not
         # recording TITLE BINARY pack.
-        bf = (pack_bytes[1] & 0x80) >> 7
+        bf = pack_bytes[1] >> 7
         return cast(
             TitleTimecode,
             cls._do_parse_binary_generic_tc(
                 pack_bytes,
                 system,
-                blank_flag=BlankFlag.CONTINUOUS if bf == 1 else BlankFlag.DISCONTINUOUS,
+                blank_flag=_bf_to_blank_flag[bf],
             ),
         )
 
 
+# Text field dispatch tables used by the timecode parse_text_value and to_text_value.  Looking the
+# conversion up in a dict avoids walking through a match statement for every field of every pack.
+def _parse_main_text_value(text_value: str) -> GenericTimecode.MainFields:
+    if not text_value:
+        # The DF bit is still set when the time is missing; see drop_frame below.
+        return GenericTimecode.MainFields(
+            hour=None, minute=None, second=None, frame=None, drop_frame=True
+        )
+    match = _smpte_time_pattern.fullmatch(text_value)
+    if not match:
+        raise ValidationError(f"Parsing error while reading timecode {text_value}.")
+    # Fetch all the groups in one call.  Frames are optional in this regex.
+    hour, minute, second, frame_separator, frame = match.group(
+        "hour", "minute", "second", "frame_separator", "frame"
+    )
+    return GenericTimecode.MainFields(
+        hour=int(hour),
+        minute=int(minute),
+        second=int(second),
+        frame=int(frame) if frame else None,
+        drop_frame=(
+            frame_separator == ";"
+            if frame_separator
+            # If the frames are missing, we'll just set the DF bit since that's how I've
+            # observed it happening in practice on a VAUX Rec Date pack from my camera.
+            # This is also the value we'd want to set if the time is missing completely.
+            else True
+        ),
+    )
+
+
+# Precomputed zero-padded text for two-digit numbers.  Out of range numbers from an invalid pack
+# still fall back to formatting the value on the fly.
+_two_digit_text: dict[int | None, str] = {number: f"{number:02}" for number in range(100)}
+
+
+def _format_main_text_value(v: GenericTimecode.MainFields) -> str:
+    if v.hour is None:
+        return ""
+    hms = (
+        (_two_digit_text.get(v.hour) or f"{v.hour:02}")
+        + ":"
+        + (_two_digit_text.get(v.minute) or f"{v.minute:02}")
+        + ":"
+        + (_two_digit_text.get(v.second) or f"{v.second:02}")
+    )
+    if v.frame is None:
+        return hms
+    return hms + (";" if v.drop_frame else ":") + (_two_digit_text.get(v.frame) or f"{v.frame:02}")
+
+
+_timecode_text_value_parsers: dict[str | None, Callable[[str], DataclassInstance]] = {
+    None: _parse_main_text_value,
+    "color_frame": lambda text_value: GenericTimecode.ColorFrameFields(
+        color_frame=ColorFrame[text_value] if text_value else None
+    ),
+    "polarity_correction": lambda text_value: GenericTimecode.PolarityCorrectionFields(
+        polarity_correction=PolarityCorrection[text_value] if text_value else None
+    ),
+    "binary_group_flags": lambda text_value: GenericTimecode.BinaryGroupFlagsFields(
+        binary_group_flags=int(text_value, 0) if text_value else None
+    ),
+}
+_timecode_text_value_formatters: dict[str | None, Callable[[Any], str]] = {
+    None: _format_main_text_value,
+    "color_frame": lambda value_subset: (
+        value_subset.color_frame.name if value_subset.color_frame is not None else ""
+    ),
+    "polarity_correction": lambda value_subset: (
+        value_subset.polarity_correction.name
+        if value_subset.polarity_correction is not None
+        else ""
+    ),
+    "binary_group_flags": lambda value_subset: (
+        du.hex_int(value_subset.binary_group_flags, 1)
+        if value_subset.binary_group_flags is not None
+        else ""
+    ),
+}
+_title_timecode_text_value_parsers: dict[str | None, Callable[[str], DataclassInstance]] = {
+    **_timecode_text_value_parsers,
+    "blank_flag": lambda text_value: TitleTimecode.BlankFlagFields(
+        blank_flag=BlankFlag[text_value] if text_value else None
+    ),
+}
+_title_timecode_text_value_formatters: dict[str | None, Callable[[Any], str]] = {
+    **_timecode_text_value_formatters,
+    "blank_flag": lambda value_subset: (
+        value_subset.blank_flag.name if value_subset.blank_flag is not None else ""
+    ),
+}
+
+
 # AAUX recording time
 # IEC 61834-4:1998 8.4 Rec Time (AAUX)
 # Also see SMPTE 12M
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AAUXRecordingTime(GenericTimecode):
     _time_required = False
     _frames_required = False
@@ -518,7 +563,7 @@ class AAUXRecordingTime(GenericTimecode):
 # VAUX recording time
 # IEC 61834-4:1998 9.4 Rec Time (VAUX)
 # Also see SMPTE 12M
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class VAUXRecordingTime(GenericTimecode):
     _time_required = False
     _frames_required = False
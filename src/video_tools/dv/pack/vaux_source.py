@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import ctypes
 from dataclasses import dataclass
 from enum import Enum, IntEnum, auto
 from typing import ClassVar
@@ -77,7 +76,7 @@ class SourceType(IntEnum):
 
 # VAUX source
 # IEC 61834-4:1998 9.1 Source (VAUX)
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class VAUXSource(Pack):
     source_code: SourceCode | None = None
     tv_channel: int | None = None
@@ -264,20 +263,11 @@ def to_text_value(cls, text_field: str | None, value_subset: DataclassInstance)
             case _:
                 assert False
 
-    class _BinaryFields(ctypes.BigEndianStructure):
-        _pack_ = 1
-        _fields_: ClassVar = [
-            ("tv_channel_tens", ctypes.c_uint8, 4),
-            ("tv_channel_units", ctypes.c_uint8, 4),
-            ("bw", ctypes.c_uint8, 1),
-            ("en", ctypes.c_uint8, 1),
-            ("clf", ctypes.c_uint8, 2),
-            ("tv_channel_hundreds", ctypes.c_uint8, 4),
-            ("source_code", ctypes.c_uint8, 2),
-            ("field_count", ctypes.c_uint8, 1),
-            ("stype", ctypes.c_uint8, 5),
-            ("tuner_category", ctypes.c_uint8, 8),
-        ]
+    # Binary layout of the pack data bytes, from the most significant bit to the least:
+    #   PC 1: TV CHANNEL tens digit (4 bits), TV CHANNEL units digit (4 bits)
+    #   PC 2: B/W (1 bit), EN (1 bit), CLF (2 bits), TV CHANNEL hundreds digit (4 bits)
+    #   PC 3: SOURCE CODE (2 bits), 50/60 (1 bit), STYPE (5 bits)
+    #   PC 4: TUNER CATEGORY (8 bits)
 
     pack_type = Type.VAUX_SOURCE
 
@@ -286,21 +276,21 @@ def _do_parse_binary(
         cls, pack_bytes: bytes, system: dv_file_info.DVSystem
     ) -> VAUXSource | None:
         # Unpack fields from bytes and validate them.
-        bin = cls._BinaryFields.from_buffer_copy(pack_bytes, 1)
+        pc1, pc2, pc3, pc4 = pack_bytes[1], pack_bytes[2], pack_bytes[3], pack_bytes[4]
+        tv_channel_tens = pc1 >> 4
+        tv_channel_units = pc1 & 0x0F
+        tv_channel_hundreds = pc2 & 0x0F
+        source_code_bits = pc3 >> 6
 
         # Figure out the source code and TV channel, which all go together
         channel_is_e = (
-            bin.tv_channel_hundreds == 0xE
-            and bin.tv_channel_tens == 0xE
-            and bin.tv_channel_units == 0xE
+            tv_channel_hundreds == 0xE and tv_channel_tens == 0xE and tv_channel_units == 0xE
         )
         channel_is_f = (
-            bin.tv_channel_hundreds == 0xF
-            and bin.tv_channel_tens == 0xF
-            and bin.tv_channel_units == 0xF
+            tv_channel_hundreds == 0xF and tv_channel_tens == 0xF and tv_channel_units == 0xF
         )
         source_code: SourceCode | None
-        match bin.source_code:
+        match source_code_bits:
             case 0x00:
                 source_code = SourceCode.CAMERA
                 # TV channel and tuner category are expected to be 0xF everywhere
@@ -317,15 +307,9 @@ def _do_parse_binary(
                 tv_channel = None
             case 0x02:
                 source_code = SourceCode.CABLE
-                if (
-                    bin.tv_channel_hundreds > 9
-                    or bin.tv_channel_tens > 9
-                    or bin.tv_channel_units > 9
-                ):
+                if tv_channel_hundreds > 9 or tv_channel_tens > 9 or tv_channel_units > 9:
                     return None
-                tv_channel = (
-                    bin.tv_channel_hundreds * 100 + bin.tv_channel_tens * 10 + bin.tv_channel_units
-                )
+                tv_channel = tv_channel_hundreds * 100 + tv_channel_tens * 10 + tv_channel_units
             case 0x03:
                 if channel_is_e:
                     source_code = SourceCode.PRERECORDED_TAPE
@@ -335,24 +319,16 @@ def _do_parse_binary(
                     tv_channel = None
                 else:
                     source_code = SourceCode.TUNER
-                    if (
-                        bin.tv_channel_hundreds > 9
-                        or bin.tv_channel_tens > 9
-                        or bin.tv_channel_units > 9
-                    ):
+                    if tv_channel_hundreds > 9 or tv_channel_tens > 9 or tv_channel_units > 9:
                         return None
-                    tv_channel = (
-                        bin.tv_channel_hundreds * 100
-                        + bin.tv_channel_tens * 10
-                        + bin.tv_channel_units
-                    )
+                    tv_channel = tv_channel_hundreds * 100 + tv_channel_tens * 10 + tv_channel_units
             case _:
                 assert False
 
         # TV tuner category varies depending on the source
         if source_code == SourceCode.TUNER:
-            tuner_category = bin.tuner_category
-        elif bin.tuner_category != 0xFF:  # should be NO INFO for every other source code
+            tuner_category = pc4
+        elif pc4 != 0xFF:  # should be NO INFO for every other source code
             return None
         else:
             tuner_category = None
@@ -361,11 +337,11 @@ def _do_parse_binary(
             source_code=source_code,
             tv_channel=tv_channel,
             tuner_category=tuner_category,
-            source_type=SourceType(bin.stype),
-            field_count=50 if bin.field_count == 1 else 60,
-            bw_flag=BlackAndWhiteFlag(bin.bw),
-            color_frames_id_valid=True if bin.en == 0 else False,
-            color_frames_id=ColorFramesID(bin.clf),
+            source_type=SourceType(pc3 & 0x1F),
+            field_count=50 if pc3 & 0x20 != 0 else 60,
+            bw_flag=BlackAndWhiteFlag(pc2 >> 7),
+            color_frames_id_valid=True if pc2 & 0x40 == 0 else False,
+            color_frames_id=ColorFramesID((pc2 >> 4) & 0x03),
         )
 
     def _do_to_binary(self, system: dv_file_info.DVSystem) -> bytes:
@@ -407,16 +383,19 @@ def _do_to_binary(self, system: dv_file_info.DVSystem) -> bytes:
         assert self.bw_flag is not None
         assert self.color_frames_id is not None
         assert self.source_type is not None
-        struct = self._BinaryFields(
-            tv_channel_tens=tv_channel_tens,
-            tv_channel_units=tv_channel_units,
-            bw=int(self.bw_flag),
-            en=0 if self.color_frames_id_valid else 1,
-            clf=int(self.color_frames_id),
-            tv_channel_hundreds=tv_channel_hundreds,
-            source_code=source_code,
-            field_count=1 if self.field_count == 50 else 0,
-            stype=int(self.source_type),
-            tuner_category=self.tuner_category if self.tuner_category is not None else 0xFF,
+        return bytes(
+            (
+                self.pack_type,
+                # PC 1
+                (tv_channel_tens << 4) | tv_channel_units,
+                # PC 2
+                (self.bw_flag << 7)
+                | (0 if self.color_frames_id_valid else 0x40)
+                | (self.color_frames_id << 4)
+                | tv_channel_hundreds,
+                # PC 3
+                (source_code << 6) | (0x20 if self.field_count == 50 else 0) | self.source_type,
+                # PC 4
+                self.tuner_category if self.tuner_category is not None else 0xFF,
+            )
         )
-        return bytes([self.pack_type, *bytes(struct)])
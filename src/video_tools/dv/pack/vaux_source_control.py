@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import ctypes
+import struct
 from dataclasses import dataclass
 from enum import IntEnum
 from typing import ClassVar
@@ -12,7 +12,14 @@
 from video_tools.typing import DataclassInstance
 
 from .base import CSVFieldMap, Pack, Type
-from .source_control import CompressionCount, CopyProtection, InputSource, SourceSituation
+from .source_control import (
+    CompressionCount,
+    CopyProtection,
+    InputSource,
+    SourceSituation,
+    _pc1_to_source_control_fields,
+    _source_control_pc1,
+)
 
 
 class VAUXRecordingMode(IntEnum):
@@ -37,10 +44,19 @@ class StillFieldPicture(IntEnum):
     TWICE_FRAME_TIME = 0x1  # 1001/60 (NTSC) or 1/50 (PAL/SECAM) seconds elapsed between fields
 
 
+_rec_mode_to_recording_mode = tuple(VAUXRecordingMode(bits) for bits in range(0x4))
+_ff_to_frame_field = (FrameField.ONLY_ONE, FrameField.BOTH)
+_fc_to_frame_change = (FrameChange.SAME_AS_PREVIOUS, FrameChange.DIFFERENT_FROM_PREVIOUS)
+_st_to_still_field_picture = (StillFieldPicture.NO_GAP, StillFieldPicture.TWICE_FRAME_TIME)
+
+# Pack type byte followed by the four data bytes as one big endian word.
+_pack_struct = struct.Struct(">BI")
+
+
 # VAUX source control
 # IEC 61834-4:1998 9.2 Source control (VAUX)
 # SMPTE 306M-2002 8.9.2 VAUX source control pack (VSC)
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class VAUXSourceControl(Pack):
     # Display format / aspect ratio
     broadcast_system: int | None = None  # Type 0 or Type 1, see IEC 61834-4
@@ -368,32 +384,16 @@ def to_text_value(cls, text_field: str | None, value_subset: DataclassInstance)
             case _:
                 assert False
 
-    class _BinaryFields(ctypes.BigEndianStructure):
-        _pack_ = 1
-        _fields_: ClassVar = [
-            # PC 1
-            ("cgms", ctypes.c_uint8, 2),
-            ("isr", ctypes.c_uint8, 2),
-            ("cmp", ctypes.c_uint8, 2),
-            ("ss", ctypes.c_uint8, 2),
-            # PC 2
-            ("rec_st", ctypes.c_uint8, 1),
-            ("one_1", ctypes.c_uint8, 1),
-            ("rec_mode", ctypes.c_uint8, 2),
-            ("one_2", ctypes.c_uint8, 1),
-            ("disp", ctypes.c_uint8, 3),
-            # PC 3
-            ("ff", ctypes.c_uint8, 1),
-            ("fs", ctypes.c_uint8, 1),
-            ("fc", ctypes.c_uint8, 1),
-            ("il", ctypes.c_uint8, 1),
-            ("st", ctypes.c_uint8, 1),
-            ("sc", ctypes.c_uint8, 1),
-            ("bcsys", ctypes.c_uint8, 2),
-            # PC 4
-            ("one_3", ctypes.c_uint8, 1),
-            ("genre_category", ctypes.c_uint8, 7),
-        ]
+    # Binary layout of the pack data bytes, from the most significant bit to the least:
+    #   PC 1: CGMS (2 bits), ISR (2 bits), CMP (2 bits), SS (2 bits)
+    #   PC 2: REC ST (1 bit), reserved bit 2 (1 bit), REC MODE (2 bits), reserved bit 1 (1 bit),
+    #         DISP (3 bits)
+    #   PC 3: FF (1 bit), FS (1 bit), FC (1 bit), IL (1 bit), ST (1 bit), SC (1 bit),
+    #         BCSYS (2 bits)
+    #   PC 4: reserved bit 0 (1 bit), GENRE CATEGORY (7 bits)
+    #
+    # The reserved bits are normally all 1.  The first byte has the same layout as in the AAUX
+    # source control pack, so both share the code for it.
 
     pack_type = Type.VAUX_SOURCE_CONTROL
 
@@ -402,56 +402,70 @@ def _do_parse_binary(
         cls, pack_bytes: bytes, system: dv_file_info.DVSystem
     ) -> VAUXSourceControl | None:
         # Unpack fields from bytes.
-        bin = cls._BinaryFields.from_buffer_copy(pack_bytes, 1)
-
+        pc1, pc2, pc3, pc4 = pack_bytes[1], pack_bytes[2], pack_bytes[3], pack_bytes[4]
+        copy_protection, input_source, compression_count, source_situation = (
+            _pc1_to_source_control_fields[pc1]
+        )
         return cls(
-            broadcast_system=bin.bcsys,
-            display_mode=bin.disp,
-            frame_field=FrameField(bin.ff),
-            first_second=2 if bin.fs == 0 else 1,
-            frame_change=FrameChange(bin.fc),
-            interlaced=True if bin.il == 1 else False,
-            still_field_picture=StillFieldPicture(bin.st),
-            still_camera_picture=True if bin.sc == 0 else False,
-            copy_protection=CopyProtection(bin.cgms),
-            source_situation=SourceSituation(bin.ss) if bin.ss != 0x3 else None,
-            input_source=InputSource(bin.isr) if bin.isr != 0x3 else None,
-            compression_count=CompressionCount(bin.cmp) if bin.cmp != 0x3 else None,
-            recording_start_point=True if bin.rec_st == 0 else False,
-            recording_mode=VAUXRecordingMode(bin.rec_mode),
-            genre_category=bin.genre_category,
-            reserved=(bin.one_1 << 2) | (bin.one_2 << 1) | bin.one_3,
+            broadcast_system=pc3 & 0x03,
+            display_mode=pc2 & 0x07,
+            frame_field=_ff_to_frame_field[pc3 >> 7],
+            first_second=2 if pc3 & 0x40 == 0 else 1,
+            frame_change=_fc_to_frame_change[(pc3 >> 5) & 0x01],
+            interlaced=True if pc3 & 0x10 != 0 else False,
+            still_field_picture=_st_to_still_field_picture[(pc3 >> 3) & 0x01],
+            still_camera_picture=True if pc3 & 0x04 == 0 else False,
+            copy_protection=copy_protection,
+            source_situation=source_situation,
+            input_source=input_source,
+            compression_count=compression_count,
+            recording_start_point=True if pc2 & 0x80 == 0 else False,
+            recording_mode=_rec_mode_to_recording_mode[(pc2 >> 4) & 0x03],
+            genre_category=pc4 & 0x7F,
+            reserved=((pc2 >> 4) & 0x4) | ((pc2 >> 2) & 0x2) | (pc4 >> 7),
         )
 
     def _do_to_binary(self, system: dv_file_info.DVSystem) -> bytes:
-        assert self.copy_protection is not None
-        assert self.recording_mode is not None
-        assert self.frame_field is not None
-        assert self.frame_change is not None
-        assert self.still_field_picture is not None
-        assert self.reserved is not None
-        struct = self._BinaryFields(
+        assert (  # assertion repeated from validate() to keep mypy happy
+            self.broadcast_system is not None
+            and self.display_mode is not None
+            and self.copy_protection is not None
+            and self.recording_mode is not None
+            and self.frame_field is not None
+            and self.frame_change is not None
+            and self.still_field_picture is not None
+            and self.genre_category is not None
+            and self.reserved is not None
+        )
+        pc1 = _source_control_pc1(
+            self.copy_protection,
+            self.input_source,
+            self.compression_count,
+            self.source_situation,
+        )
+        rec_st = 0 if self.recording_start_point else 1
+        fs = 0 if self.first_second == 2 else 1
+        il = 1 if self.interlaced else 0
+        sc = 0 if self.still_camera_picture else 1
+        return _pack_struct.pack(
+            self.pack_type,
             # PC 1
-            cgms=int(self.copy_protection),
-            isr=int(self.input_source) if self.input_source is not None else 0x3,
-            cmp=int(self.compression_count) if self.compression_count is not None else 0x3,
-            ss=int(self.source_situation) if self.source_situation is not None else 0x3,
+            (pc1 << 24)
             # PC 2
-            rec_st=0 if self.recording_start_point else 1,
-            one_1=(self.reserved >> 2) & 0x1,
-            rec_mode=int(self.recording_mode),
-            one_2=(self.reserved >> 1) & 0x1,
-            disp=self.display_mode,
+            | (rec_st << 23)
+            | (((self.reserved >> 2) & 0x1) << 22)
+            | (int(self.recording_mode) << 20)
+            | (((self.reserved >> 1) & 0x1) << 19)
+            | (self.display_mode << 16)
             # PC 3
-            ff=int(self.frame_field),
-            fs=0 if self.first_second == 2 else 1,
-            fc=int(self.frame_change),
-            il=1 if self.interlaced else 0,
-            st=int(self.still_field_picture),
-            sc=0 if self.still_camera_picture else 1,
-            bcsys=self.broadcast_system,
+            | (int(self.frame_field) << 15)
+            | (fs << 14)
+            | (int(self.frame_change) << 13)
+            | (il << 12)
+            | (int(self.still_field_picture) << 11)
+            | (sc << 10)
+            | (self.broadcast_system << 8)
             # PC 4
-            one_3=self.reserved & 0x1,
-            genre_category=self.genre_category,
+            | ((self.reserved & 0x1) << 7)
+            | self.genre_category,
         )
-        return bytes([self.pack_type, *bytes(struct)])
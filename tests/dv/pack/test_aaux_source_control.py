@@ -246,6 +246,17 @@ def test_aaux_source_control_binary(tc: PackBinaryTestCase) -> None:
     test_base.run_pack_binary_test_case(tc)
 
 
+def test_aaux_source_control_parsed_packs_are_valid() -> None:
+    # parse_binary skips validate() for this pack type, so make sure the parser can't produce an
+    # invalid pack from any value of the two bytes that hold enumerations with gaps.
+    for pc1 in range(0x100):
+        for pc2 in range(0x100):
+            p = pack.AAUXSourceControl._do_parse_binary(
+                bytes([pack.Type.AAUX_SOURCE_CONTROL, pc1, pc2, 0xFF, 0xFF]), test_base.NTSC
+            )
+            assert p is None or p.validate(test_base.NTSC) is None
+
+
 SIMPLE_AAUX_SOURCE_CONTROL = pack.AAUXSourceControl(
     copy_protection=pack.CopyProtection.NO_RESTRICTION,
     source_situation=None,
@@ -310,6 +321,14 @@ def test_aaux_source_control_binary(tc: PackBinaryTestCase) -> None:
             replace(SIMPLE_AAUX_SOURCE_CONTROL, playback_speed=Fraction(100)),
             "Unsupported playback speed selected.  Only certain fractional values allowed.",
         ),
+        PackValidateCase(
+            "invalid non-fraction playback speed",
+            replace(
+                SIMPLE_AAUX_SOURCE_CONTROL,
+                playback_speed=0.3,  # type: ignore[arg-type]
+            ),
+            "Unsupported playback speed selected.  Only certain fractional values allowed.",
+        ),
         PackValidateCase(
             "no reserved",
             replace(SIMPLE_AAUX_SOURCE_CONTROL, reserved=None),
@@ -332,6 +351,15 @@ def test_aaux_source_control_validate(tc: PackValidateCase) -> None:
     test_base.run_pack_validate_case(tc)
 
 
+def test_aaux_source_control_non_fraction_playback_speed() -> None:
+    # Any number equal to a supported speed is accepted, such as a float.
+    p = replace(SIMPLE_AAUX_SOURCE_CONTROL, playback_speed=0.5)  # type: ignore[arg-type]
+    assert p.validate(test_base.NTSC) is None
+    assert p.to_binary(test_base.NTSC) == replace(
+        SIMPLE_AAUX_SOURCE_CONTROL, playback_speed=Fraction(1, 2)
+    ).to_binary(test_base.NTSC)
+
+
 @pytest.mark.parametrize(
     "tc",
     [
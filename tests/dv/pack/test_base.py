@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+import numpy as np
 import pytest
 
 import video_tools.dv.file.info as dv_file_info
@@ -56,6 +57,10 @@ def run_pack_text_success_test_case(tc: PackTextSuccessTestCase, cls: type[pack.
     """Test round trip of a pack from text, to parsed, and then back to text."""
     p = cls.parse_text_values(tc.input)
     assert p == tc.parsed
+    # Each text field also parses on its own into the matching subset of the pack values.
+    for text_field, text_value in tc.input.items():
+        value_subset = cls.parse_text_value(text_field, text_value)
+        assert value_subset == p.value_subset_for_text_field(text_field)
     output = tc.output if tc.output is not None else tc.input
     assert p.to_text_values() == output
 
@@ -83,3 +88,71 @@ def test_base_pack_validation() -> None:
     with pytest.raises(AssertionError):
         # wrong length
         pack.NoInfo.parse_binary(bytes.fromhex("FF FF FF FF"), NTSC)
+
+
+def test_base_pack_binary_memoization() -> None:
+    # Identical pack bytes should hand back the same immutable instance.
+    input = bytes.fromhex("51 03 CF A0 FF")
+    p1 = pack.AAUXSourceControl.parse_binary(input, NTSC)
+    p2 = pack.AAUXSourceControl.parse_binary(bytes.fromhex("51 03 CF A0 FF"), NTSC)
+    assert p1 is not None
+    assert p1 is p2
+    assert p1.to_binary(NTSC) == input
+    assert p1.to_binary(NTSC) is p1.to_binary(NTSC)
+
+    # Validation failures are never memoized.
+    invalid = pack.AAUXSourceControl()
+    for _ in range(2):
+        with pytest.raises(pack.ValidationError, match="Copy protection status is required."):
+            invalid.to_binary(NTSC)
+
+
+def test_base_pack_binary_batch() -> None:
+    valid = bytes.fromhex("51 03 CF A0 FF")
+    invalid = bytes.fromhex("51 03 C7 A0 FF")  # no recording mode
+    packs = np.frombuffer(valid + invalid + valid, dtype=np.uint8).reshape(-1, 5)
+    parsed = pack.AAUXSourceControl.parse_binary_batch(packs, NTSC)
+    assert len(parsed) == 3
+    assert parsed[0] == pack.AAUXSourceControl.parse_binary(valid, NTSC)
+    assert parsed[1] is None
+    assert parsed[2] is parsed[0]
+
+    empty = np.zeros((0, 5), dtype=np.uint8)
+    assert pack.AAUXSourceControl.parse_binary_batch(empty, NTSC) == []
+
+
+def test_parse_binary_batch() -> None:
+    input = bytes.fromhex("51 03 CF A0 FF 70 C8 1F FE 80 51 03 CF A0 FF 51 03 C7 A0 FF")
+    packs = np.frombuffer(input, dtype=np.uint8).reshape(-1, 5)
+    parsed = pack.parse_binary_batch(packs, NTSC)
+    assert parsed == [pack.parse_binary(row.tobytes(), NTSC) for row in packs]
+    assert isinstance(parsed[0], pack.AAUXSourceControl)
+    assert isinstance(parsed[1], pack.CameraConsumer1)
+    assert parsed[2] is parsed[0]
+    assert parsed[3] is None
+
+    assert pack.parse_binary_batch(np.zeros((0, 5), dtype=np.uint8), NTSC) == []
+
+
+def test_base_pack_validate_batch() -> None:
+    valid = pack.AAUXSourceControl.parse_binary(bytes.fromhex("51 03 CF A0 FF"), NTSC)
+    assert valid is not None
+    invalid = pack.AAUXSourceControl()
+    mask = pack.Pack.validate_batch([valid, invalid, valid], NTSC)
+    assert mask.tolist() == [True, False, True]
+    assert pack.Pack.validate_batch([], NTSC).shape == (0,)
+
+
+def test_base_pack_to_binary_batch() -> None:
+    input = bytes.fromhex("51 03 CF A0 FF 70 C8 1F FE 80 51 03 CF A0 FF")
+    packs = np.frombuffer(input, dtype=np.uint8).reshape(-1, 5)
+    parsed = [pack.parse_binary(row.tobytes(), NTSC) for row in packs]
+    assert all(parsed)
+    output = pack.Pack.to_binary_batch([p for p in parsed if p is not None], NTSC)
+    assert output.shape == (3, 5)
+    assert output.tobytes() == input
+    output[0, 1] = 0x00  # rows can be patched in place
+
+    assert pack.Pack.to_binary_batch([], NTSC).shape == (0, 5)
+    with pytest.raises(pack.ValidationError, match="Copy protection status is required."):
+        pack.Pack.to_binary_batch([pack.AAUXSourceControl()], NTSC)
@@ -1,6 +1,7 @@
 """Test packs that store consumer camera data."""
 
 from dataclasses import replace
+from fractions import Fraction
 
 import pytest
 
@@ -151,6 +152,16 @@ def test_camera_consumer_1_binary(tc: PackBinaryTestCase) -> None:
             replace(SIMPLE_CAMERA_CONSUMER_1, iris=50.2),
             "Unsupported iris value selected.  Only certain numbers are allowed.",
         ),
+        PackValidateCase(
+            "infinite iris",
+            replace(SIMPLE_CAMERA_CONSUMER_1, iris=float("inf")),
+            "Unsupported iris value selected.  Only certain numbers are allowed.",
+        ),
+        PackValidateCase(
+            "NaN iris",
+            replace(SIMPLE_CAMERA_CONSUMER_1, iris=float("nan")),
+            "Unsupported iris value selected.  Only certain numbers are allowed.",
+        ),
         PackValidateCase(
             "auto gain control too low",
             replace(SIMPLE_CAMERA_CONSUMER_1, auto_gain_control=-1),
@@ -178,6 +189,12 @@ def test_camera_consumer_1_validate(tc: PackValidateCase) -> None:
     test_base.run_pack_validate_case(tc)
 
 
+def test_camera_consumer_1_iris_rounding() -> None:
+    # F numbers that are not exactly in the table are rounded to one decimal place.
+    p = replace(SIMPLE_CAMERA_CONSUMER_1, iris=1.15)
+    assert p.to_binary(test_base.NTSC)[1] == 0xC1
+
+
 @pytest.mark.parametrize(
     "tc",
     [
@@ -393,6 +410,24 @@ def test_camera_consumer_2_binary(tc: PackBinaryTestCase) -> None:
             replace(SIMPLE_CAMERA_CONSUMER_2, electric_zoom_magnification=8.5),
             "Unsupported electric zoom value selected.  Only certain numbers are allowed.",
         ),
+        PackValidateCase(
+            "infinite electric zoom",
+            replace(SIMPLE_CAMERA_CONSUMER_2, electric_zoom_magnification=float("inf")),
+            "Unsupported electric zoom value selected.  Only certain numbers are allowed.",
+        ),
+        PackValidateCase(
+            "NaN electric zoom",
+            replace(SIMPLE_CAMERA_CONSUMER_2, electric_zoom_magnification=float("nan")),
+            "Unsupported electric zoom value selected.  Only certain numbers are allowed.",
+        ),
+        PackValidateCase(
+            "electric zoom not on a table entry",
+            replace(
+                SIMPLE_CAMERA_CONSUMER_2,
+                electric_zoom_magnification=Fraction(1, 3),  # type: ignore[arg-type]
+            ),
+            "Unsupported electric zoom value selected.  Only certain numbers are allowed.",
+        ),
     ],
     ids=lambda tc: tc.name,
 )
@@ -400,6 +435,12 @@ def test_camera_consumer_2_validate(tc: PackValidateCase) -> None:
     test_base.run_pack_validate_case(tc)
 
 
+def test_camera_consumer_2_electric_zoom_rounding() -> None:
+    # Magnifications that are not exactly in the table are rounded to one decimal place.
+    p = replace(SIMPLE_CAMERA_CONSUMER_2, electric_zoom_magnification=1.15)
+    assert p.to_binary(test_base.NTSC)[4] & 0x7F == 0x11
+
+
 @pytest.mark.parametrize(
     "tc",
     [
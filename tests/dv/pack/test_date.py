@@ -413,6 +413,20 @@ def test_vaux_recording_date_text_success(tc: PackTextSuccessTestCase) -> None:
             },
             "Parsing error while reading date blah.",
         ),
+        PackTextParseFailureTestCase(
+            "date with short year",
+            {
+                None: "99-01-02",
+            },
+            "Parsing error while reading date 99-01-02.",
+        ),
+        PackTextParseFailureTestCase(
+            "date with extra group",
+            {
+                None: "1999-01-02-03",
+            },
+            "Parsing error while reading date 1999-01-02-03.",
+        ),
         PackTextParseFailureTestCase(
             "invalid time zone",
             {
@@ -420,6 +434,13 @@ def test_vaux_recording_date_text_success(tc: PackTextSuccessTestCase) -> None:
             },
             "Parsing error while reading time zone blah.",
         ),
+        PackTextParseFailureTestCase(
+            "time zone with space padding",
+            {
+                "tz": " 1:30",
+            },
+            "Parsing error while reading time zone  1:30.",
+        ),
         PackTextParseFailureTestCase(
             "time zone not on 30 minute increment",
             {
@@ -504,6 +504,37 @@ def test_time_increment(
     assert results == expectations
 
 
+@pytest.mark.parametrize(
+    "val",
+    [
+        pack.TitleTimecode(
+            hour=1,
+            minute=2,
+            second=3,
+            frame=4,
+            drop_frame=False,
+            color_frame=pack.ColorFrame.SYNCHRONIZED,
+            polarity_correction=pack.PolarityCorrection.ODD,
+            binary_group_flags=0x5,
+            blank_flag=pack.BlankFlag.CONTINUOUS,
+        ),
+        pack.VAUXRecordingTime(
+            hour=1,
+            minute=2,
+            second=3,
+            frame=4,
+            drop_frame=False,
+            color_frame=pack.ColorFrame.SYNCHRONIZED,
+            polarity_correction=pack.PolarityCorrection.ODD,
+            binary_group_flags=0x5,
+        ),
+    ],
+    ids=lambda val: type(val).__name__,
+)
+def test_time_increment_keeps_other_fields(val: pack.GenericTimecode) -> None:
+    assert val.increment_frame(NTSC) == replace(val, frame=5)
+
+
 @pytest.mark.parametrize(
     "value,message,system",
     [